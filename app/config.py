@@ -1,20 +1,46 @@
 import os
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application configuration settings"""
 
     # Proxy settings
-    USE_PROXIES: bool = os.getenv('USE_PROXIES', 'true').lower() == 'true'
-    PROXY_UPDATE_INTERVAL: int = int(
-        os.getenv('PROXY_UPDATE_INTERVAL', '300'))  # 5 minutes
-    MAX_PROXY_WORKERS: int = int(os.getenv('MAX_PROXY_WORKERS', '20'))
-    MAX_WORKING_PROXIES: int = int(os.getenv('MAX_WORKING_PROXIES', '10'))
+    USE_PROXIES: bool = True
+    PROXY_UPDATE_INTERVAL: int = 300  # 5 minutes
+    MAX_PROXY_WORKERS: int = 20
+    MAX_WORKING_PROXIES: int = 10
+
+    # Scraping settings
+    MAX_CONCURRENT_SCRAPES: int = 16
+    DETAIL_FETCH_WORKERS: int = 8
 
     # Fallback behavior (defaults to false to prevent rate limiting)
-    PROXY_FALLBACK_ENABLED: bool = os.getenv(
-        'PROXY_FALLBACK_ENABLED', 'false').lower() == 'true'
+    PROXY_FALLBACK_ENABLED: bool = False
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Read settings from environment variables"""
+        return cls(
+            USE_PROXIES=os.getenv('USE_PROXIES', 'true').lower() == 'true',
+            PROXY_UPDATE_INTERVAL=int(
+                os.getenv('PROXY_UPDATE_INTERVAL', '300')),
+            MAX_PROXY_WORKERS=int(os.getenv('MAX_PROXY_WORKERS', '20')),
+            MAX_WORKING_PROXIES=int(os.getenv('MAX_WORKING_PROXIES', '10')),
+            MAX_CONCURRENT_SCRAPES=int(
+                os.getenv('MAX_CONCURRENT_SCRAPES', '16')),
+            DETAIL_FETCH_WORKERS=int(os.getenv('DETAIL_FETCH_WORKERS', '8')),
+            PROXY_FALLBACK_ENABLED=os.getenv(
+                'PROXY_FALLBACK_ENABLED', 'false').lower() == 'true',
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, reading the environment only once"""
+    return Settings.from_env()
 
 
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,58 @@
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import MagicMock, Mock
+from app import scrape_jobs
+from app.config import Settings
+from app.proxy_manager import proxy_manager
+
+
+@pytest.fixture(autouse=True)
+def block_live_proxy_system(monkeypatch):
+    """Keep the real proxy manager off the network, so results don't depend on
+    connectivity and parallel workers don't each fetch and probe proxies"""
+    def _no_network(*args, **kwargs):
+        raise RuntimeError("tests must mock the proxy manager rather than use the network")
+
+    monkeypatch.setattr(proxy_manager, "_load_proxies", _no_network)
+    monkeypatch.setattr(proxy_manager, "_probe_proxy", _no_network)
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """Import the FastAPI app once per session, only for tests that need it"""
+    from app.main import app
+    # Build the OpenAPI schema once; FastAPI memoizes it on the app
+    app.openapi()
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app_instance):
+    """Share one test client, and its app lifespan, across the whole session"""
+    with TestClient(app_instance) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def mock_scrape_jobs(monkeypatch):
+    """Replace JobSpy's scrape_jobs with a mock that finds no jobs by default"""
+    # spec_set keeps the mock to the real function's attributes
+    mock = Mock(spec_set=scrape_jobs.scrape_jobs, return_value=pd.DataFrame())
+    monkeypatch.setattr(scrape_jobs, "scrape_jobs", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_settings(monkeypatch):
+    """Replace the settings the scraper reads"""
+    mock = MagicMock(spec_set=Settings)
+    monkeypatch.setattr(scrape_jobs, "settings", mock)
+    return mock
+
+
+@pytest.fixture
+def proxies_disabled(mock_settings):
+    """Scrape without proxies, so tests never reach the real proxy system"""
+    mock_settings.USE_PROXIES = False
+    return mock_settings
@@ -0,0 +1,163 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
+from markdownify import markdownify
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Job pages are fetched concurrently rather than one at a time
+DETAIL_FETCH_WORKERS = settings.DETAIL_FETCH_WORKERS
+DETAIL_FETCH_TIMEOUT = 15
+
+HEADERS = {
+    "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "accept-language": "en-US,en;q=0.9",
+    "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+}
+
+
+def _create_session() -> requests.Session:
+    """Create a session whose keep-alive pool is shared by every scrape"""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        # Room for every fetch worker to keep its connection alive
+        pool_maxsize=max(64, DETAIL_FETCH_WORKERS),
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Reused across requests so job pages don't each pay a TCP+TLS handshake
+_session = _create_session()
+
+# Job postings rarely change, so parsed details are kept for an hour and
+# then revalidated with the page's ETag/Last-Modified where it sent them
+DETAIL_CACHE_TTL = 3600
+DETAIL_CACHE_MAX_SIZE = 1024
+_details_cache: "OrderedDict[str, tuple[float, dict, dict]]" = OrderedDict()
+_details_cache_lock = threading.Lock()
+
+
+def _get_cached_details(job_url: str) -> Optional[tuple[float, dict, dict]]:
+    with _details_cache_lock:
+        cached = _details_cache.get(job_url)
+        if cached is not None:
+            _details_cache.move_to_end(job_url)
+        return cached
+
+
+def _store_cached_details(job_url: str, details: dict, validators: dict) -> None:
+    with _details_cache_lock:
+        _details_cache[job_url] = (time.monotonic(), details, validators)
+        _details_cache.move_to_end(job_url)
+        while len(_details_cache) > DETAIL_CACHE_MAX_SIZE:
+            _details_cache.popitem(last=False)
+
+
+def job_url_for(job_id: str) -> str:
+    """Build the LinkedIn job page URL for a JobSpy job id ("li-123" or "123")"""
+    return f"https://www.linkedin.com/jobs/view/{job_id.removeprefix('li-')}"
+
+
+def parse_job_details(html: str) -> dict:
+    """Extract the markdown description and employment type from a LinkedIn job page"""
+    soup = BeautifulSoup(html, "html.parser")
+
+    markup = soup.find("div", class_="show-more-less-html__markup")
+    description = markdownify(
+        markup.decode_contents()).strip() if markup else None
+
+    job_type = None
+    heading = soup.find(
+        "h3",
+        class_="description__job-criteria-subheader",
+        string=lambda text: text and "Employment type" in text,
+    )
+    criteria = heading.find_next_sibling(
+        "span", class_="description__job-criteria-text") if heading else None
+    if criteria:
+        # "Full-time" -> "fulltime", matching JobSpy's job_type values
+        job_type = criteria.get_text(strip=True).lower().replace("-", "")
+
+    return {"description": description or None, "job_type": job_type}
+
+
+def _fetch_job_details(job_url: str, proxy: Optional[str]) -> dict:
+    """Fetch a single job page, returning empty details if it can't be read"""
+    cached = _get_cached_details(job_url)
+    if cached and time.monotonic() - cached[0] < DETAIL_CACHE_TTL:
+        return cached[1]
+
+    try:
+        response = _session.get(
+            job_url,
+            headers=cached[2] if cached else None,
+            proxies={"http": proxy, "https": proxy} if proxy else None,
+            timeout=DETAIL_FETCH_TIMEOUT
+        )
+        if response.status_code == 304 and cached:
+            _store_cached_details(job_url, cached[1], cached[2])
+            return cached[1]
+        if response.status_code != 200:
+            logger.warning("Job page returned status %d: %s",
+                           response.status_code, job_url)
+            return {}
+
+        details = parse_job_details(response.text)
+
+        # Only cache pages we could read, so blocked responses are retried
+        if details["description"]:
+            validators = {}
+            if response.headers.get("ETag"):
+                validators["If-None-Match"] = response.headers["ETag"]
+            if response.headers.get("Last-Modified"):
+                validators["If-Modified-Since"] = response.headers["Last-Modified"]
+            _store_cached_details(job_url, details, validators)
+
+        return details
+    except Exception as e:
+        logger.warning("Failed to fetch job details from %s: %s", job_url, e)
+        return {}
+
+
+def iter_job_details(job_urls: List[str], proxies: Optional[List[str]] = None) -> Iterator[tuple[int, dict]]:
+    """Yield (index, details) for each job page as soon as it has been fetched"""
+    if not job_urls:
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(DETAIL_FETCH_WORKERS, len(job_urls)))
+    try:
+        # Rotate through proxies so pages are spread across them
+        futures = {
+            executor.submit(
+                _fetch_job_details, job_url,
+                proxies[i % len(proxies)] if proxies else None): i
+            for i, job_url in enumerate(job_urls)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # Drop pending fetches if the consumer stops early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_job_details(job_urls: List[str], proxies: Optional[List[str]] = None) -> List[dict]:
+    """Fetch details for each job page concurrently, rotating through proxies"""
+    details = [{} for _ in job_urls]
+    for i, job_details in iter_job_details(job_urls, proxies):
+        details[i] = job_details
+    return details
@@ -1,9 +1,24 @@
-from fastapi import FastAPI, Depends, Query, HTTPException
-from fastapi.responses import JSONResponse
-from typing import Annotated
-from app.scrape_jobs import get_jobs
-from app.models import Job, JobSearchParams, JobSearchResponse
+from fastapi import FastAPI, Depends, Path, Query, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Callable
+import asyncio
+import hashlib
+import time
+from app.scrape_jobs import get_jobs, iter_jobs_with_details, resolve_proxies
+from app.models import (
+    Job,
+    JobDescriptionResponse,
+    JobSearchParams,
+    JobSearchResponse,
+    ProxyHealthResponse,
+    RefreshProxiesResponse,
+    ScrapingHealthResponse,
+)
 from app.proxy_manager import proxy_manager
+from app.config import Settings, get_settings
+from app.job_details import fetch_job_details, job_url_for
 
 app = FastAPI(
     title="JobSpy API",
@@ -13,7 +28,76 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# Scrapes get their own bounded pool so they can't exhaust the shared
+# threadpool that sync endpoints and dependencies run on
+_SCRAPE_POOL = ThreadPoolExecutor(
+    max_workers=get_settings().MAX_CONCURRENT_SCRAPES, thread_name_prefix="scrape")
+
+# Health responses are cached briefly so frequent monitor polling
+# doesn't contend on the proxy manager lock or trigger refreshes
+HEALTH_CACHE_TTL = 15
+_health_cache: dict[str, tuple[float, dict]] = {}
+
+
+def _cached(key: str, ttl: float, producer: Callable[[], dict]) -> dict:
+    """Return a cached value for key, calling producer once it has expired"""
+    now = time.monotonic()
+    cached = _health_cache.get(key)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+
+    result = producer()
+    _health_cache[key] = (now, result)
+    return result
+
+
+# Large job responses are mostly repetitive markdown, so they compress well;
+# compresslevel 5 keeps most of the size win for much less CPU than 9.
+# Added before the ETag middleware so ETags identify the encoded body.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+# GET endpoints whose responses carry an ETag so pollers can revalidate
+ETAG_PATHS = {"/jobs", "/health/proxies", "/health/scraping"}
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/")
+                  for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
 
+@app.middleware("http")
+async def add_etag(request: Request, call_next):
+    """Tag successful GET responses and answer matching revalidations with 304"""
+    response = await call_next(request)
+
+    if (request.method != "GET" or response.status_code != 200 or
+            request.url.path not in ETAG_PATHS):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = dict(response.headers)
+    headers["etag"] = etag
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        headers.pop("content-length", None)
+        headers.pop("content-type", None)
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers=headers,
+        media_type=response.media_type
+    )
+
+
+# Declaring response models lets FastAPI serialize straight to JSON bytes
+# with Pydantic, so endpoints keep the default response class
 @app.get(
     "/jobs",
     response_model=JobSearchResponse,
@@ -21,21 +105,93 @@ app = FastAPI(
 async def search_jobs(
     params: Annotated[JobSearchParams, Query()]
 ) -> JobSearchResponse:
-    return get_jobs(params)
+    # Scraping blocks for seconds, so keep it off the event loop
+    return await asyncio.get_running_loop().run_in_executor(
+        _SCRAPE_POOL, get_jobs, params)
+
+
+@app.get(
+    "/jobs/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def stream_jobs(
+    params: Annotated[JobSearchParams, Query()]
+) -> Response:
+    """Stream jobs as newline-delimited JSON, each one as soon as it is ready"""
+    loop = asyncio.get_running_loop()
+    # The listing is shared with /jobs; descriptions are fetched while streaming
+    listing = await loop.run_in_executor(
+        _SCRAPE_POOL, get_jobs,
+        params.model_copy(update={"include_descriptions": False}))
 
+    if not listing.success:
+        return Response(content=listing.model_dump_json(),
+                        media_type="application/json")
 
-@app.get("/health/proxies")
-async def proxy_health():
+    if not params.include_descriptions:
+        jobs = iter(listing.jobs)
+    else:
+        # Proxies are resolved before streaming starts, so job pages are never
+        # fetched directly when fallback is disabled and failures are still
+        # reported as a ScrapingError rather than a truncated stream. They
+        # follow the same settings as the listing, and reuse its probe results
+        proxies, error = await loop.run_in_executor(_SCRAPE_POOL, resolve_proxies)
+        if error is not None:
+            return Response(content=error.model_dump_json(),
+                            media_type="application/json")
+        jobs = iter_jobs_with_details(listing.jobs, proxies)
+    return StreamingResponse(
+        (job.model_dump_json() + "\n" for job in jobs),
+        media_type="application/x-ndjson"
+    )
+
+
+@app.get("/jobs/{job_id}/description", response_model=JobDescriptionResponse)
+def job_description(
+    job_id: Annotated[str, Path(pattern=r"^(li-)?\d+$")],
+    settings: Annotated[Settings, Depends(get_settings)]
+) -> JobDescriptionResponse:
+    """Fetch a single job's full description"""
+    # Same proxy probing and fallback rules as searches
+    proxies, error = resolve_proxies(
+        settings.USE_PROXIES, settings.PROXY_FALLBACK_ENABLED)
+    if error is not None:
+        raise HTTPException(status_code=503, detail=error.error.message)
+
+    job_url = job_url_for(job_id)
+    details = fetch_job_details([job_url], proxies)[0]
+    if not details.get("description"):
+        raise HTTPException(
+            status_code=502, detail="Job description could not be fetched")
+
+    return JobDescriptionResponse(
+        id=job_id,
+        job_url=job_url,
+        description=details["description"],
+        job_type=details.get("job_type")
+    )
+
+
+def _compute_proxy_health() -> dict:
+    proxies = proxy_manager.get_proxy_list()
+
+    return {
+        "proxy_system_enabled": True,
+        "working_proxies": len(proxies),
+        "last_update": proxy_manager.last_update,
+        "is_stale": proxy_manager.is_stale,
+        "status": "healthy" if proxies else "no_proxies_available"
+    }
+
+
+@app.get("/health/proxies", response_model=ProxyHealthResponse)
+async def proxy_health(response: Response):
     """Check proxy system health"""
     try:
-        proxies = proxy_manager.get_proxy_list()
-
-        return {
-            "proxy_system_enabled": True,
-            "working_proxies": len(proxies) if proxies else 0,
-            "last_update": proxy_manager.last_update,
-            "status": "healthy" if proxies else "no_proxies_available"
-        }
+        result = _cached("proxies", HEALTH_CACHE_TTL, _compute_proxy_health)
+        response.headers["Cache-Control"] = f"max-age={HEALTH_CACHE_TTL}, public"
+        return result
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -48,28 +204,36 @@ async def proxy_health():
         )
 
 
-@app.get("/health/scraping")
-async def scraping_health():
-    """Check if scraping is currently available"""
-    from app.config import settings
+def _compute_scraping_health(settings: Settings) -> dict:
+    scraping_available = True
+    reason = "Scraping is available"
 
-    try:
-        scraping_available = True
-        reason = "Scraping is available"
+    if settings.USE_PROXIES and not settings.PROXY_FALLBACK_ENABLED:
+        proxies = proxy_manager.get_proxy_list()
+        if not proxies:
+            scraping_available = False
+            reason = "Scraping unavailable: No working proxies and fallback disabled"
 
-        if settings.USE_PROXIES and not settings.PROXY_FALLBACK_ENABLED:
-            proxies = proxy_manager.get_proxy_list()
-            if not proxies:
-                scraping_available = False
-                reason = "Scraping unavailable: No working proxies and fallback disabled"
+    return {
+        "scraping_available": scraping_available,
+        "use_proxies": settings.USE_PROXIES,
+        "fallback_enabled": settings.PROXY_FALLBACK_ENABLED,
+        "working_proxies": len(proxy_manager.get_proxy_list()),
+        "reason": reason
+    }
 
-        return {
-            "scraping_available": scraping_available,
-            "use_proxies": settings.USE_PROXIES,
-            "fallback_enabled": settings.PROXY_FALLBACK_ENABLED,
-            "working_proxies": len(proxy_manager.get_proxy_list() or []),
-            "reason": reason
-        }
+
+@app.get("/health/scraping", response_model=ScrapingHealthResponse)
+async def scraping_health(
+    response: Response,
+    settings: Annotated[Settings, Depends(get_settings)]
+):
+    """Check if scraping is currently available"""
+    try:
+        result = _cached("scraping", HEALTH_CACHE_TTL,
+                         lambda: _compute_scraping_health(settings))
+        response.headers["Cache-Control"] = f"max-age={HEALTH_CACHE_TTL}, public"
+        return result
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -81,14 +245,16 @@ async def scraping_health():
         )
 
 
-@app.post("/admin/refresh-proxies")
-async def refresh_proxies():
+@app.post("/admin/refresh-proxies", response_model=RefreshProxiesResponse)
+async def refresh_proxies(response: Response):
     """Manually refresh proxy list (admin endpoint)"""
+    response.headers["Cache-Control"] = "no-store"
     try:
         proxies = proxy_manager.get_proxy_list(force_refresh=True)
+        _health_cache.clear()
         return {
             "message": "Proxy list refreshed",
-            "working_proxies": len(proxies) if proxies else 0
+            "working_proxies": len(proxies)
         }
     except Exception as e:
         raise HTTPException(
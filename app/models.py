@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal
 
 
 class JobSearchParams(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     # Required fields
     search_term: str = Field(
         description="The job title or keywords to search for",
@@ -41,9 +43,17 @@ class JobSearchParams(BaseModel):
         ge=1,
         description="Only return jobs posted within this many hours",
     )
+    include_descriptions: bool = Field(
+        default=False,
+        description="Fetch each job's full description and employment type (slower; "
+        "descriptions can also be fetched per job from /jobs/{job_id}/description)",
+    )
 
 
 class Job(BaseModel):
+    # JobSpy returns many more columns than we expose; drop them rather than error
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     id: str | None = Field(
         default=None,
         description="Unique job identifier"
@@ -82,8 +92,24 @@ class Job(BaseModel):
     )
 
 
+class JobDescriptionResponse(BaseModel):
+    """Response model for a single job's description"""
+    id: str = Field(description="Unique job identifier")
+
+    job_url: str = Field(description="URL to the job posting")
+
+    description: str = Field(description="Job description in markdown format")
+
+    job_type: str | None = Field(
+        default=None,
+        description="Employment type",
+    )
+
+
 class ScrapingError(BaseModel):
     """Structured error information for scraping failures"""
+    model_config = ConfigDict(frozen=True)
+
     error_type: Literal[
         "proxy_unavailable",
         "proxy_fetch_failed",
@@ -98,14 +124,17 @@ class ScrapingError(BaseModel):
         description="Additional error details and context"
     )
 
-    suggested_actions: list[str] = Field(
-        default_factory=list,
+    suggested_actions: tuple[str, ...] = Field(
+        default=(),
         description="Suggested actions to resolve the issue"
     )
 
 
 class JobSearchResponse(BaseModel):
     """Response model for job search requests"""
+    # Responses are cached and shared between requests, so keep them immutable
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(description="Whether the search was successful")
 
     jobs: list[Job] = Field(
@@ -122,3 +151,45 @@ class JobSearchResponse(BaseModel):
         default=None,
         description="Additional metadata about the search"
     )
+
+
+class ProxyHealthResponse(BaseModel):
+    """Response model for proxy system health checks"""
+    proxy_system_enabled: bool = Field(
+        description="Whether the proxy system is enabled")
+
+    working_proxies: int = Field(
+        description="Number of working proxies currently available")
+
+    last_update: float = Field(
+        description="Unix timestamp of the last successful proxy refresh")
+
+    is_stale: bool = Field(
+        description="Whether the last refresh failed and an older proxy list is being served")
+
+    status: Literal["healthy", "no_proxies_available"] = Field(
+        description="Overall proxy system status")
+
+
+class ScrapingHealthResponse(BaseModel):
+    """Response model for scraping availability checks"""
+    scraping_available: bool = Field(
+        description="Whether job scraping is currently possible")
+
+    use_proxies: bool = Field(description="Whether proxy support is enabled")
+
+    fallback_enabled: bool = Field(
+        description="Whether scraping without proxies is allowed")
+
+    working_proxies: int = Field(
+        description="Number of working proxies currently available")
+
+    reason: str = Field(description="Explanation of the availability status")
+
+
+class RefreshProxiesResponse(BaseModel):
+    """Response model for manual proxy refreshes"""
+    message: str = Field(description="Result of the refresh")
+
+    working_proxies: int = Field(
+        description="Number of working proxies after the refresh")
@@ -1,13 +1,40 @@
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import time
-from typing import List, Optional
+from typing import List, Optional, Set
 from urllib.parse import urlparse
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from app.config import settings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 logger = logging.getLogger(__name__)
 
+# Proxy protocols we can't use yet
+_SKIPPED_PROTOCOLS = ('socks4://', 'socks5://', 'https://')
+
+# Connectivity checks that answer with an empty 204, so no body is transferred
+_TEST_URLS = (
+    "http://www.gstatic.com/generate_204",
+    "http://httpbin.org/status/204",
+)
+
+# Checked right before a scrape, so proxies are known to reach the site itself
+_PROBE_URL = "https://www.linkedin.com/"
+_PROBE_TIMEOUT = 3
+# Probe results are reused briefly, so back-to-back scrapes and page fetches
+# don't each pay for a full probe burst
+_PROBE_CACHE_TTL = 60
+
+
+def _create_session() -> requests.Session:
+    """Create a session with a keep-alive connection pool"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
 
 class ProxyManager:
     """Manages free proxy lists and validation"""
@@ -16,8 +43,25 @@ class ProxyManager:
         self.proxies: List[str] = []
         self.working_proxies: List[str] = []
         self.last_update = 0
-        self.update_interval = 300  # 5 minutes
+        self.update_interval = settings.PROXY_UPDATE_INTERVAL
+        self.max_workers = settings.MAX_PROXY_WORKERS
+        self.max_working = settings.MAX_WORKING_PROXIES
+        self.max_staleness = 1800  # 30 minutes
+        self.is_stale = False
         self._lock = threading.Lock()
+        self._refresh_event: Optional[threading.Event] = None
+        self._session = _create_session()
+        self._probe_results: dict[str, tuple[float, bool]] = {}
+        # Each validation worker thread keeps its own pooled session
+        self._local = threading.local()
+
+    def _get_thread_session(self) -> requests.Session:
+        """Get the pooled session for the current thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = _create_session()
+            self._local.session = session
+        return session
 
     def _fetch_free_proxies(self) -> List[str]:
         """Fetch free proxies from Proxifly"""
@@ -27,50 +71,66 @@ class ProxyManager:
             # "https://cdn.jsdelivr.net/gh/proxifly/free-proxy-list@main/proxies/countries/US/data.txt",
         ]
 
-        all_proxies = []
-
-        for url in proxy_urls:
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    proxies = response.text.strip().split('\n')
-                    # Filter and format proxies - only keep HTTP ones and avoid double prefixes
-                    formatted_proxies = []
-                    for proxy in proxies:
-                        proxy = proxy.strip()
-                        if proxy:
-                            # If proxy already has a protocol, use as-is (if it's http)
-                            if proxy.startswith('http://'):
-                                formatted_proxies.append(proxy)
-                            # If proxy starts with other protocols, skip for now
-                            elif proxy.startswith(('socks4://', 'socks5://', 'https://')):
-                                continue
-                            # If no protocol, assume HTTP
-                            elif ':' in proxy:
-                                formatted_proxies.append(f"http://{proxy}")
-
-                    all_proxies.extend(formatted_proxies)
-                    logger.info(
-                        f"Fetched {len(formatted_proxies)} HTTP proxies from {url}")
-            except Exception as e:
-                logger.warning(f"Failed to fetch proxies from {url}: {e}")
-
-        # Remove duplicates
-        return list(set(all_proxies))
-
-    def _test_proxy(self, proxy: str, timeout: int = 10) -> bool:
+        # Accumulate into a set so duplicates are dropped while parsing
+        all_proxies: Set[str] = set()
+
+        # Fetch all lists concurrently so latency is the slowest source, not the sum
+        with ThreadPoolExecutor(max_workers=len(proxy_urls)) as executor:
+            for formatted_proxies in executor.map(self._fetch_proxy_url, proxy_urls):
+                all_proxies.update(formatted_proxies)
+
+        return list(all_proxies)
+
+    def _fetch_proxy_url(self, url: str) -> Set[str]:
+        """Fetch and parse HTTP proxies from a single proxy list URL"""
+        formatted_proxies: Set[str] = set()
+        response = None
+
+        try:
+            response = self._session.get(url, timeout=10, stream=True)
+            if response.status_code == 200:
+                # Lines are decoded as text even if the server omits a charset
+                response.encoding = response.encoding or 'utf-8'
+
+                # Stream lines rather than holding the whole body and a split copy
+                for line in response.iter_lines(decode_unicode=True):
+                    proxy = line.strip()
+                    if not proxy or ':' not in proxy:
+                        continue
+                    # If proxy already has a protocol, use as-is (if it's http)
+                    if proxy.startswith('http://'):
+                        formatted_proxies.add(proxy)
+                    # If proxy starts with other protocols, skip for now
+                    elif proxy.startswith(_SKIPPED_PROTOCOLS):
+                        continue
+                    # If no protocol, assume HTTP
+                    else:
+                        formatted_proxies.add(f"http://{proxy}")
+
+                logger.info("Fetched %d HTTP proxies from %s",
+                            len(formatted_proxies), url)
+        except Exception as e:
+            logger.warning("Failed to fetch proxies from %s: %s", url, e)
+        finally:
+            if response is not None:
+                response.close()
+
+        return formatted_proxies
+
+    def _test_proxy(self, proxy: str, timeout: int = 5) -> bool:
         """Test if a proxy is working"""
         try:
-            test_urls = ["http://httpbin.org/ip", "http://icanhazip.com"]
+            session = self._get_thread_session()
 
-            for test_url in test_urls:
-                response = requests.get(
+            for test_url in _TEST_URLS:
+                response = session.head(
                     test_url,
                     proxies={"http": proxy, "https": proxy},
-                    timeout=timeout
+                    timeout=timeout,
+                    allow_redirects=False
                 )
 
-                if response.status_code == 200:
+                if response.status_code == 204:
                     return True
 
         except Exception:
@@ -78,56 +138,169 @@ class ProxyManager:
 
         return False
 
-    def _validate_proxies(self, proxies: List[str], max_workers: int = 20) -> List[str]:
+    def _probe_proxy(self, proxy: str) -> bool:
+        """Check that a proxy can reach LinkedIn without an error response"""
+        try:
+            response = self._get_thread_session().head(
+                _PROBE_URL,
+                proxies={"http": proxy, "https": proxy},
+                timeout=_PROBE_TIMEOUT,
+                allow_redirects=False
+            )
+            return response.status_code < 400
+        except Exception:
+            return False
+
+    def probe_proxies(self, proxies: List[str]) -> List[str]:
+        """Return the proxies that can reach LinkedIn, in their original order"""
+        if not proxies:
+            return []
+
+        now = time.monotonic()
+        with self._lock:
+            reachable = {
+                proxy: result[1] for proxy in proxies
+                if (result := self._probe_results.get(proxy))
+                and now - result[0] < _PROBE_CACHE_TTL
+            }
+
+        unprobed = [proxy for proxy in proxies if proxy not in reachable]
+        if unprobed:
+            # Probe all proxies at once so the check costs at most one timeout
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unprobed))) as executor:
+                results = list(executor.map(self._probe_proxy, unprobed))
+            reachable.update(zip(unprobed, results))
+
+            with self._lock:
+                self._probe_results = {
+                    proxy: result for proxy, result in self._probe_results.items()
+                    if now - result[0] < _PROBE_CACHE_TTL
+                }
+                self._probe_results.update(
+                    (proxy, (now, ok)) for proxy, ok in zip(unprobed, results))
+
+        working = [proxy for proxy in proxies if reachable[proxy]]
+        logger.info("%d of %d proxies can reach LinkedIn",
+                    len(working), len(proxies))
+        return working
+
+    def _validate_proxies(self, proxies: List[str], max_workers: Optional[int] = None) -> List[str]:
         """Validate proxies concurrently"""
         working_proxies = []
+        # Test enough candidates to plausibly find max_working live proxies
+        candidates = proxies[:max(50, self.max_working * 5)]
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            results = executor.map(
-                self._test_proxy, proxies[:50])  # Test first 50
+        executor = ThreadPoolExecutor(max_workers=max_workers or self.max_workers)
+        try:
+            futures = {
+                executor.submit(self._test_proxy, proxy): proxy
+                for proxy in candidates
+            }
 
-            for proxy, is_working in zip(proxies[:50], results):
-                if is_working:
+            # Collect results as they finish so slow proxies don't block fast ones
+            for future in as_completed(futures):
+                if future.result():
+                    proxy = futures[future]
                     working_proxies.append(proxy)
-                    logger.debug(f"✅ Proxy working: {proxy}")
+                    logger.debug("✅ Proxy working: %s", proxy)
 
                     # Stop after finding enough working proxies
-                    if len(working_proxies) >= 10:
+                    if len(working_proxies) >= self.max_working:
                         break
+        finally:
+            # Drop pending tests rather than waiting for them to time out
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        logger.info(f"Found {len(working_proxies)} working proxies")
+        logger.info("Found %d working proxies", len(working_proxies))
         return working_proxies
 
-    def get_proxy_list(self, force_refresh: bool = False) -> Optional[List[str]]:
+    def _load_proxies(self) -> List[str]:
+        """Fetch and validate a fresh proxy list"""
+        fresh_proxies = self._fetch_free_proxies()
+
+        if not fresh_proxies:
+            logger.warning("Failed to fetch any proxies")
+            return []
+
+        validated_proxies = self._validate_proxies(fresh_proxies)
+        if not validated_proxies:
+            logger.warning("No working proxies found")
+
+        return validated_proxies
+
+    def _apply_refresh(self, validated_proxies: List[str], current_time: float) -> None:
+        """Swap in a refreshed proxy list (caller must hold the lock)"""
+        if validated_proxies:
+            self.working_proxies = validated_proxies
+            self.last_update = current_time
+            self.is_stale = False
+            logger.info("Updated proxy list with %d working proxies",
+                        len(self.working_proxies))
+        # Keep serving the last known good list until it is too old
+        elif self.working_proxies:
+            if current_time - self.last_update > self.max_staleness:
+                logger.warning("Discarding stale proxy list")
+                self.working_proxies = []
+                self.is_stale = False
+            else:
+                logger.warning("Serving stale list of %d proxies",
+                               len(self.working_proxies))
+                self.is_stale = True
+
+    def _refresh(self, event: threading.Event) -> None:
+        """Run a refresh without holding the lock, then wake any waiters"""
+        try:
+            validated_proxies = self._load_proxies()
+            with self._lock:
+                self._apply_refresh(validated_proxies, time.time())
+        finally:
+            with self._lock:
+                self._refresh_event = None
+            event.set()
+
+    def _refresh_in_background(self, event: threading.Event) -> None:
+        """Refresh the proxy list from a background thread"""
+        try:
+            self._refresh(event)
+        except Exception as e:
+            logger.warning("Background proxy refresh failed: %s", e)
+
+    def get_proxy_list(self, force_refresh: bool = False) -> List[str]:
         """Get list of working proxies"""
         current_time = time.time()
 
         with self._lock:
             # Check if we need to update
-            if (force_refresh or
-                current_time - self.last_update > self.update_interval or
+            if not (force_refresh or
+                    current_time - self.last_update > self.update_interval or
                     not self.working_proxies):
+                return self.working_proxies
 
-                logger.info("Refreshing proxy list...")
-
-                # Fetch new proxies
-                fresh_proxies = self._fetch_free_proxies()
+            # Only one refresh runs at a time; other callers share its result
+            event = self._refresh_event
+            is_leader = event is None
+            if is_leader:
+                event = self._refresh_event = threading.Event()
 
-                if fresh_proxies:
-                    # Validate proxies
-                    self.working_proxies = self._validate_proxies(
-                        fresh_proxies)
-                    self.last_update = current_time
+            # Serve the current list while an expired one refreshes,
+            # only blocking callers when there is nothing to serve
+            if self.working_proxies and not force_refresh:
+                if is_leader:
+                    logger.info("Refreshing proxy list in background...")
+                    threading.Thread(
+                        target=self._refresh_in_background, args=(event,),
+                        daemon=True).start()
+                return self.working_proxies
 
-                    if self.working_proxies:
-                        logger.info(
-                            f"Updated proxy list with {len(self.working_proxies)} working proxies")
-                    else:
-                        logger.warning("No working proxies found")
-                else:
-                    logger.warning("Failed to fetch any proxies")
+        if is_leader:
+            logger.info("Refreshing proxy list...")
+            self._refresh(event)
+        else:
+            logger.info("Waiting for in-progress proxy refresh...")
+            event.wait(timeout=60)
 
-            return self.working_proxies if self.working_proxies else None
+        with self._lock:
+            return self.working_proxies
 
 
 # Global proxy manager instance
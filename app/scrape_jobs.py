@@ -1,82 +1,330 @@
+import numpy as np
 import pandas as pd
 from jobspy import scrape_jobs
+from pydantic import TypeAdapter
 from app.models import JobSearchParams, Job, JobSearchResponse, ScrapingError
 from app.proxy_manager import proxy_manager
+from app.job_details import fetch_job_details, iter_job_details
 from app.config import settings
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Iterator, List, Optional
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Successful searches are cached briefly so bursts of identical requests
+# don't each trigger a full multi-second LinkedIn scrape
+JOBS_CACHE_TTL = 90
+JOBS_CACHE_MAX_SIZE = 256
+_jobs_cache: "OrderedDict[JobSearchParams, tuple[float, JobSearchResponse]]" = OrderedDict()
+_jobs_cache_lock = threading.Lock()
+
+# Searches currently being scraped, so identical concurrent requests share one scrape
+_in_flight: dict[JobSearchParams, Future] = {}
+_in_flight_lock = threading.Lock()
+
+# How long a search waits on an identical in-flight scrape before giving up,
+# so a stuck leader can't pin scrape pool threads indefinitely
+IN_FLIGHT_WAIT_TIMEOUT = 120
+
+
+def _cache_key(params: JobSearchParams) -> JobSearchParams:
+    """Normalize search params into a cache key covering every search field"""
+    # Frozen models are hashable, so new search fields are keyed automatically
+    return params.model_copy(update={
+        "search_term": params.search_term.lower(),
+        "location": params.location.lower(),
+    })
+
+
+def _get_cached_jobs(key: JobSearchParams) -> Optional[JobSearchResponse]:
+    now = time.monotonic()
+    with _jobs_cache_lock:
+        cached = _jobs_cache.get(key)
+        if cached is None:
+            return None
+        if now - cached[0] >= JOBS_CACHE_TTL:
+            del _jobs_cache[key]
+            return None
+        _jobs_cache.move_to_end(key)
+        return cached[1]
+
+
+def _store_cached_jobs(key: JobSearchParams, response: JobSearchResponse) -> None:
+    with _jobs_cache_lock:
+        _jobs_cache[key] = (time.monotonic(), response)
+        _jobs_cache.move_to_end(key)
+        while len(_jobs_cache) > JOBS_CACHE_MAX_SIZE:
+            _jobs_cache.popitem(last=False)
+
+
+# Suggested actions are the same on every failure, so they're built once
+_PROXY_UNAVAILABLE_ACTIONS = (
+    "Try refreshing the proxy list: POST /admin/refresh-proxies",
+    "Enable fallback scraping: set PROXY_FALLBACK_ENABLED=true (may cause rate limiting)",
+    "Check proxy system health: GET /health/proxies",
+    "Wait a few minutes and try again as new proxies may become available",
+)
+_PROXY_FETCH_FAILED_ACTIONS = (
+    "Check network connectivity",
+    "Try refreshing the proxy list: POST /admin/refresh-proxies",
+    "Enable fallback scraping: set PROXY_FALLBACK_ENABLED=true (may cause rate limiting)",
+    "Check proxy system health: GET /health/proxies",
+)
+_SCRAPING_FAILED_ACTIONS_FALLBACK = (
+    "Check network connectivity",
+    "Verify search parameters are valid",
+    "Try again in a few minutes",
+    "Check if LinkedIn is accessible",
+)
+_SCRAPING_FAILED_ACTIONS_NOFALLBACK = (
+    "Enable fallback scraping: set PROXY_FALLBACK_ENABLED=true",
+    "Check proxy system: GET /health/proxies",
+    "Try refreshing proxies: POST /admin/refresh-proxies",
+    "Verify search parameters are valid",
+)
+
+# Error type, message template and suggested actions for each way a search fails
+_ERRORS: dict[str, tuple[str, str, tuple[str, ...]]] = {
+    "proxy_unavailable": (
+        "proxy_unavailable",
+        "No working proxies available and fallback is disabled",
+        _PROXY_UNAVAILABLE_ACTIONS,
+    ),
+    "proxy_fetch_failed": (
+        "proxy_fetch_failed",
+        "Failed to fetch proxies and fallback is disabled: {error}",
+        _PROXY_FETCH_FAILED_ACTIONS,
+    ),
+    "scraping_failed": (
+        "scraping_failed",
+        "Scraping failed: {error}",
+        _SCRAPING_FAILED_ACTIONS_FALLBACK,
+    ),
+    "scraping_failed_no_fallback": (
+        "scraping_failed",
+        "Scraping failed and fallback is disabled: {error}",
+        _SCRAPING_FAILED_ACTIONS_NOFALLBACK,
+    ),
+}
+
+
+def _error_response(kind: str, details: dict, error: Exception | None = None) -> JobSearchResponse:
+    """Build the failed search response for one of the _ERRORS kinds"""
+    error_type, message, suggested_actions = _ERRORS[kind]
+    return JobSearchResponse(
+        success=False,
+        jobs=[],
+        error=ScrapingError(
+            error_type=error_type,
+            message=message.format(error=error),
+            details=details,
+            suggested_actions=suggested_actions
+        )
+    )
+
+
+# Job fields in declaration order, computed once rather than per request
+_JOB_FIELDS = tuple(Job.model_fields.keys())
+
+# Validates a whole batch of jobs in pydantic-core in one call
+_JOBS_ADAPTER = TypeAdapter(List[Job])
+
+
+def _to_records(jobs_df: pd.DataFrame) -> List[dict]:
+    """Convert scraped jobs to records, keeping only the fields we expose"""
+    # Missing columns come back as nulls, which are normalized to None below
+    values = jobs_df.reindex(columns=_JOB_FIELDS).to_numpy(dtype=object, copy=True)
+
+    # Mask every null marker (None, NaN, NA, NaT) in one vectorized pass
+    # rather than checking each value in Python
+    np.copyto(values, None, where=pd.isna(values))
+
+    return [dict(zip(_JOB_FIELDS, row)) for row in values.tolist()]
+
+
+def _fill_job_details(records: List[dict], proxies: List[str] | None) -> None:
+    """Fetch descriptions for jobs that lack one, concurrently rather than one page at a time"""
+    missing = [record for record in records
+               if record["job_url"] and record["description"] is None]
+    if not missing:
+        return
+
+    details = fetch_job_details(
+        [record["job_url"] for record in missing], proxies)
+
+    for record, job_details in zip(missing, details):
+        for field in ("description", "job_type"):
+            if record[field] is None:
+                record[field] = job_details.get(field)
+
+
+def iter_jobs_with_details(jobs: List[Job], proxies: List[str] | None = None) -> Iterator[Job]:
+    """Yield jobs as soon as their details are available, fetching any that are missing"""
+    missing = []
+    for job in jobs:
+        if job.job_url and job.description is None:
+            missing.append(job)
+        else:
+            yield job
+
+    if not missing:
+        return
+
+    for i, job_details in iter_job_details([job.job_url for job in missing], proxies):
+        job = missing[i]
+        yield job.model_copy(update={
+            field: job_details.get(field)
+            for field in ("description", "job_type")
+            if getattr(job, field) is None
+        })
+
+
+def _to_jobs(jobs_df: pd.DataFrame, proxies: List[str] | None = None,
+             include_details: bool = False) -> List[Job]:
+    """Convert scraped jobs to Job models, optionally filling in missing details"""
+    records = _to_records(jobs_df)
+    if include_details:
+        _fill_job_details(records, proxies)
+
+    return _JOBS_ADAPTER.validate_python(records)
+
+
+def _scrape(scrape_kwargs: dict, include_details: bool) -> List[Job]:
+    """Scrape job listings with JobSpy, then fetch their details concurrently if asked"""
+    jobs_df = scrape_jobs(**scrape_kwargs)
+    return _to_jobs(jobs_df, scrape_kwargs["proxies"], include_details)
+
 
 def get_jobs(params: JobSearchParams) -> JobSearchResponse:
+    key = _cache_key(params)
+    cached = _get_cached_jobs(key)
+    if cached is not None:
+        logger.info("Serving cached jobs for: %s in %s",
+                    params.search_term, params.location)
+        return cached
+
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _in_flight[key] = future
+
+    if not is_leader:
+        logger.info("Waiting for in-flight search for: %s in %s",
+                    params.search_term, params.location)
+        try:
+            return future.result(timeout=IN_FLIGHT_WAIT_TIMEOUT)
+        except FutureTimeoutError:
+            logger.warning("Timed out waiting for in-flight search for: %s in %s",
+                           params.search_term, params.location)
+            error = TimeoutError(
+                f"timed out after {IN_FLIGHT_WAIT_TIMEOUT}s waiting for an identical search")
+            return _error_response("scraping_failed", {
+                "error": str(error),
+                "waited_seconds": IN_FLIGHT_WAIT_TIMEOUT
+            }, error)
+
+    start = time.perf_counter()
+    try:
+        response = _search_jobs(params)
+        _log_search_outcome(params, response, time.perf_counter() - start)
+
+        # Only cache successes so transient failures aren't pinned
+        if response.success:
+            _store_cached_jobs(key, response)
+
+        future.set_result(response)
+        return response
+    except BaseException as e:
+        # Waiters must always be released, even if the leader is interrupted
+        future.set_exception(e)
+        raise
+    finally:
+        with _in_flight_lock:
+            _in_flight.pop(key, None)
+
+
+def _log_search_outcome(params: JobSearchParams, response: JobSearchResponse,
+                        elapsed: float) -> None:
+    """Log one summary record per scrape instead of one per step"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    # Fields are also attached to the record for structured log handlers
+    fields = {
+        "outcome": "success" if response.success else response.error.error_type,
+        "n_jobs": len(response.jobs),
+        "used_proxies": (response.metadata or {}).get("used_proxies", 0),
+        "elapsed_ms": round(elapsed * 1000),
+    }
+    logger.info(
+        "Search for %s in %s finished: outcome=%s jobs=%d used_proxies=%d elapsed_ms=%d",
+        params.search_term, params.location, *fields.values(), extra=fields)
+
+
+def resolve_proxies(use_proxies: bool | None = None, fallback_enabled: bool | None = None
+                    ) -> tuple[List[str] | None, JobSearchResponse | None]:
+    """Get the proxies to scrape LinkedIn through, or the error response if
+    there are none and falling back to a direct connection isn't allowed.
+
+    Settings default to the ones the scraper itself reads.
+    """
+    if use_proxies is None:
+        use_proxies = settings.USE_PROXIES
+    if fallback_enabled is None:
+        fallback_enabled = settings.PROXY_FALLBACK_ENABLED
+
+    if not use_proxies:
+        return None, None
+
     try:
-        logger.info(
-            f"Scraping jobs for: {params.search_term} in {params.location}")
-
-        # Get proxy list automatically if enabled
-        proxies = None
-        if settings.USE_PROXIES:
-            try:
-                proxies = proxy_manager.get_proxy_list()
-                if proxies:
-                    logger.info(f"Using {len(proxies)} proxies for scraping")
-                else:
-                    logger.warning("No working proxies available")
-                    if not settings.PROXY_FALLBACK_ENABLED:
-                        logger.error(
-                            "PROXY_FALLBACK_ENABLED is false and no proxies are available. "
-                            "Aborting scrape to prevent rate limiting.")
-                        return JobSearchResponse(
-                            success=False,
-                            jobs=[],
-                            error=ScrapingError(
-                                error_type="proxy_unavailable",
-                                message="No working proxies available and fallback is disabled",
-                                details={
-                                    "proxy_system_enabled": settings.USE_PROXIES,
-                                    "fallback_enabled": settings.PROXY_FALLBACK_ENABLED,
-                                    "working_proxies": 0
-                                },
-                                suggested_actions=[
-                                    "Try refreshing the proxy list: POST /admin/refresh-proxies",
-                                    "Enable fallback scraping: set PROXY_FALLBACK_ENABLED=true (may cause rate limiting)",
-                                    "Check proxy system health: GET /health/proxies",
-                                    "Wait a few minutes and try again as new proxies may become available"
-                                ]
-                            )
-                        )
-                    else:
-                        logger.info(
-                            "Continuing without proxies (fallback enabled)")
-            except Exception as e:
-                logger.warning(f"Failed to get proxies: {e}")
-                if not settings.PROXY_FALLBACK_ENABLED:
-                    logger.error(
-                        "PROXY_FALLBACK_ENABLED is false and failed to get proxies. "
-                        "Aborting scrape to prevent rate limiting.")
-                    return JobSearchResponse(
-                        success=False,
-                        jobs=[],
-                        error=ScrapingError(
-                            error_type="proxy_fetch_failed",
-                            message=f"Failed to fetch proxies and fallback is disabled: {str(e)}",
-                            details={
-                                "proxy_system_enabled": settings.USE_PROXIES,
-                                "fallback_enabled": settings.PROXY_FALLBACK_ENABLED,
-                                "error_details": str(e)
-                            },
-                            suggested_actions=[
-                                "Check network connectivity",
-                                "Try refreshing the proxy list: POST /admin/refresh-proxies",
-                                "Enable fallback scraping: set PROXY_FALLBACK_ENABLED=true (may cause rate limiting)",
-                                "Check proxy system health: GET /health/proxies"
-                            ]
-                        )
-                    )
-                else:
-                    logger.info(
-                        "Continuing without proxies (fallback enabled)")
+        # Drop proxies that can't reach LinkedIn right now, rather than
+        # finding out from a failed scrape
+        proxies = proxy_manager.probe_proxies(proxy_manager.get_proxy_list())
+        if proxies:
+            return proxies, None
+
+        logger.warning("No working proxies available")
+        if not fallback_enabled:
+            logger.error(
+                "PROXY_FALLBACK_ENABLED is false and no proxies are available. "
+                "Aborting scrape to prevent rate limiting.")
+            return None, _error_response("proxy_unavailable", {
+                "proxy_system_enabled": use_proxies,
+                "fallback_enabled": fallback_enabled,
+                "working_proxies": 0
+            })
+    except Exception as e:
+        logger.warning("Failed to get proxies: %s", e)
+        if not fallback_enabled:
+            logger.error(
+                "PROXY_FALLBACK_ENABLED is false and failed to get proxies. "
+                "Aborting scrape to prevent rate limiting.")
+            return None, _error_response("proxy_fetch_failed", {
+                "proxy_system_enabled": use_proxies,
+                "fallback_enabled": fallback_enabled,
+                "error_details": str(e)
+            }, e)
+
+    logger.info("Continuing without proxies (fallback enabled)")
+    return None, None
+
+
+def _search_jobs(params: JobSearchParams) -> JobSearchResponse:
+    # Read settings once so the whole search sees one consistent view
+    use_proxies = settings.USE_PROXIES
+    fallback_enabled = settings.PROXY_FALLBACK_ENABLED
+
+    proxies = None
+    try:
+        proxies, error = resolve_proxies(use_proxies, fallback_enabled)
+        if error is not None:
+            return error
 
         # Build kwargs dict, only excluding job_type if None
         scrape_kwargs = {
@@ -89,8 +337,9 @@ def get_jobs(params: JobSearchParams) -> JobSearchResponse:
             "offset": params.offset,
             "is_remote": params.is_remote,
             "description_format": "markdown",
-            "linkedin_fetch_description": True,
-            "proxies": proxies  # Add proxy support
+            # Descriptions are fetched concurrently afterwards, see _fill_job_details
+            "linkedin_fetch_description": False,
+            "proxies": proxies or None  # Add proxy support
         }
 
         # Only add job_type if it's specified
@@ -98,25 +347,15 @@ def get_jobs(params: JobSearchParams) -> JobSearchResponse:
             scrape_kwargs["job_type"] = params.job_type
 
         # Scrape jobs from LinkedIn with proxy support
-        jobs_df = scrape_jobs(**scrape_kwargs)
-
-        # Normalize null values to None for Pydantic compatibility
-        jobs_df = jobs_df.astype(object).where(pd.notnull(jobs_df), None)
+        validated_jobs = _scrape(scrape_kwargs, params.include_descriptions)
 
-        # Convert to list of dictionaries
-        jobs_list = jobs_df.to_dict(orient="records")
-
-        # Convert to Pydantic models for validation
-        validated_jobs = [Job(**job_data) for job_data in jobs_list]
-
-        logger.info(f"Successfully scraped {len(validated_jobs)} jobs")
         return JobSearchResponse(
             success=True,
             jobs=validated_jobs,
             metadata={
                 "total_results": len(validated_jobs),
                 "used_proxies": len(proxies) if proxies else 0,
-                "proxy_enabled": settings.USE_PROXIES,
+                "proxy_enabled": use_proxies,
                 "search_params": {
                     "search_term": params.search_term,
                     "location": params.location,
@@ -126,101 +365,11 @@ def get_jobs(params: JobSearchParams) -> JobSearchResponse:
         )
 
     except Exception as e:
-        # If scraping fails with proxies, retry without them
-        if proxies and settings.PROXY_FALLBACK_ENABLED and "proxy" in str(e).lower():
-            logger.warning(f"Proxy scraping failed: {e}")
-            logger.info("Retrying without proxies...")
-
-            try:
-                # Remove proxies from kwargs and retry
-                scrape_kwargs["proxies"] = None
-                jobs_df = scrape_jobs(**scrape_kwargs)
-
-                # Normalize null values to None for Pydantic compatibility
-                jobs_df = jobs_df.astype(object).where(
-                    pd.notnull(jobs_df), None)
-
-                # Convert to list of dictionaries
-                jobs_list = jobs_df.to_dict(orient="records")
-
-                # Convert to Pydantic models for validation
-                validated_jobs = [Job(**job_data) for job_data in jobs_list]
-
-                logger.info(
-                    f"Successfully scraped {len(validated_jobs)} jobs without proxies")
-                return JobSearchResponse(
-                    success=True,
-                    jobs=validated_jobs,
-                    metadata={
-                        "total_results": len(validated_jobs),
-                        "used_proxies": 0,
-                        "proxy_enabled": settings.USE_PROXIES,
-                        "fallback_used": True,
-                        "original_error": str(e),
-                        "search_params": {
-                            "search_term": params.search_term,
-                            "location": params.location,
-                            "results_wanted": params.results_wanted
-                        }
-                    }
-                )
-            except Exception as fallback_error:
-                logger.error(
-                    f"Fallback scraping also failed: {str(fallback_error)}")
-                return JobSearchResponse(
-                    success=False,
-                    jobs=[],
-                    error=ScrapingError(
-                        error_type="scraping_failed",
-                        message="Both proxy and fallback scraping failed",
-                        details={
-                            "original_error": str(e),
-                            "fallback_error": str(fallback_error),
-                            "proxy_enabled": settings.USE_PROXIES,
-                            "fallback_enabled": settings.PROXY_FALLBACK_ENABLED
-                        },
-                        suggested_actions=[
-                            "Check network connectivity",
-                            "Verify search parameters are valid",
-                            "Try again in a few minutes",
-                            "Check service status: GET /health/proxies"
-                        ]
-                    )
-                )
-        else:
-            # Determine error type based on context
-            if settings.PROXY_FALLBACK_ENABLED:
-                error_type = "scraping_failed"
-                message = f"Scraping failed: {str(e)}"
-                suggested_actions = [
-                    "Check network connectivity",
-                    "Verify search parameters are valid",
-                    "Try again in a few minutes",
-                    "Check if LinkedIn is accessible"
-                ]
-            else:
-                error_type = "scraping_failed"
-                message = f"Scraping failed and fallback is disabled: {str(e)}"
-                suggested_actions = [
-                    "Enable fallback scraping: set PROXY_FALLBACK_ENABLED=true",
-                    "Check proxy system: GET /health/proxies",
-                    "Try refreshing proxies: POST /admin/refresh-proxies",
-                    "Verify search parameters are valid"
-                ]
-
-            logger.error(f"Error scraping jobs: {str(e)}")
-            return JobSearchResponse(
-                success=False,
-                jobs=[],
-                error=ScrapingError(
-                    error_type=error_type,
-                    message=message,
-                    details={
-                        "error": str(e),
-                        "proxy_enabled": settings.USE_PROXIES,
-                        "fallback_enabled": settings.PROXY_FALLBACK_ENABLED,
-                        "had_proxies": proxies is not None and len(proxies) > 0
-                    },
-                    suggested_actions=suggested_actions
-                )
-            )
+        logger.error("Error scraping jobs: %s", e)
+        return _error_response(
+            "scraping_failed" if fallback_enabled else "scraping_failed_no_fallback", {
+                "error": str(e),
+                "proxy_enabled": use_proxies,
+                "fallback_enabled": fallback_enabled,
+                "had_proxies": bool(proxies)
+            }, e)
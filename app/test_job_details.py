@@ -0,0 +1,127 @@
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from app import job_details
+from app.job_details import fetch_job_details, iter_job_details, parse_job_details
+
+JOB_PAGE = """
+<html><body>
+<div class="show-more-less-html__markup"><p>Build <strong>great</strong> APIs</p></div>
+<ul>
+  <li>
+    <h3 class="description__job-criteria-subheader">Employment type</h3>
+    <span class="description__job-criteria-text">Full-time</span>
+  </li>
+</ul>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_details_cache():
+    """Ensure cached job pages don't leak between tests"""
+    job_details._details_cache.clear()
+    yield
+    job_details._details_cache.clear()
+
+
+class TestJobDetails:
+
+    def test_parse_job_details(self):
+        """Test description and employment type are extracted from a job page"""
+        details = parse_job_details(JOB_PAGE)
+
+        assert details["description"] == "Build **great** APIs"
+        assert details["job_type"] == "fulltime"
+
+    def test_parse_job_details_missing_sections(self):
+        """Test pages without a description or criteria return None values"""
+        details = parse_job_details("<html><body></body></html>")
+
+        assert details == {"description": None, "job_type": None}
+
+    def test_fetch_job_details_rotates_proxies(self):
+        """Test job pages are fetched with proxies assigned in rotation"""
+        mock_response = Mock(status_code=200, text=JOB_PAGE, headers={})
+        job_urls = [f"https://www.linkedin.com/jobs/view/{i}" for i in range(3)]
+
+        with patch('requests.Session.get', return_value=mock_response) as mock_get:
+            details = fetch_job_details(
+                job_urls, ["http://proxy1:8080", "http://proxy2:8080"])
+
+        assert [d["job_type"] for d in details] == ["fulltime"] * 3
+        used_proxies = sorted(
+            call.kwargs["proxies"]["http"] for call in mock_get.call_args_list)
+        assert used_proxies == [
+            "http://proxy1:8080", "http://proxy1:8080", "http://proxy2:8080"]
+
+    def test_fetch_job_details_handles_failures(self):
+        """Test unreadable job pages produce empty details"""
+        with patch('requests.Session.get', side_effect=Exception("Blocked")):
+            details = fetch_job_details(["https://www.linkedin.com/jobs/view/1"])
+
+        assert details == [{}]
+
+    def test_fetch_job_details_no_urls(self):
+        """Test no requests are made when there are no job URLs"""
+        with patch('requests.Session.get') as mock_get:
+            assert fetch_job_details([]) == []
+
+        mock_get.assert_not_called()
+
+    def test_iter_job_details_yields_as_pages_complete(self):
+        """Test details are yielded with their index as each page finishes"""
+        slow = threading.Event()
+
+        def mock_get(url, **kwargs):
+            if url.endswith("/0"):
+                slow.wait(timeout=5)
+            return Mock(status_code=200, text=JOB_PAGE, headers={})
+
+        job_urls = [f"https://www.linkedin.com/jobs/view/{i}" for i in range(2)]
+        with patch('requests.Session.get', side_effect=mock_get):
+            results = iter_job_details(job_urls)
+            first_index, first_details = next(results)
+            slow.set()
+            rest = list(results)
+
+        assert first_index == 1
+        assert first_details["job_type"] == "fulltime"
+        assert [index for index, _ in rest] == [0]
+
+    def test_fetch_job_details_reuses_session(self):
+        """Test every fetch goes through the shared pooled session"""
+        mock_response = Mock(status_code=200, text=JOB_PAGE, headers={})
+
+        with patch('app.job_details._session') as mock_session:
+            mock_session.get.return_value = mock_response
+            fetch_job_details(["https://www.linkedin.com/jobs/view/1",
+                               "https://www.linkedin.com/jobs/view/2"])
+
+        assert mock_session.get.call_count == 2
+
+    def test_fetch_job_details_serves_cached_pages(self):
+        """Test a job page read once is served from the cache"""
+        mock_response = Mock(status_code=200, text=JOB_PAGE, headers={})
+        job_url = "https://www.linkedin.com/jobs/view/1"
+
+        with patch('requests.Session.get', return_value=mock_response) as mock_get:
+            first = fetch_job_details([job_url])
+            second = fetch_job_details([job_url])
+
+        assert first == second
+        mock_get.assert_called_once()
+
+    def test_fetch_job_details_revalidates_expired_pages(self):
+        """Test expired pages are revalidated with their ETag and reused on 304"""
+        job_url = "https://www.linkedin.com/jobs/view/1"
+        page = Mock(status_code=200, text=JOB_PAGE, headers={"ETag": '"abc"'})
+        not_modified = Mock(status_code=304, text="", headers={})
+
+        with patch('requests.Session.get', side_effect=[page, not_modified]) as mock_get:
+            first = fetch_job_details([job_url])
+            with patch.object(job_details, 'DETAIL_CACHE_TTL', 0):
+                second = fetch_job_details([job_url])
+
+        assert second == first
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
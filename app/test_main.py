@@ -1,25 +1,82 @@
-from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock
 import pytest
-from app.main import app
-from app.models import Job, JobSearchParams
+import threading
+import pandas as pd
+from fastapi import routing as fastapi_routing
+from pydantic import ValidationError
+from app import main, scrape_jobs
+from app.main import _health_cache
+from app.models import Job, JobSearchParams, ScrapingError
+from app.scrape_jobs import _jobs_cache
+from app.config import Settings, get_settings
+from app.proxy_manager import proxy_manager as real_proxy_manager
+
+# Models are frozen, so read-only tests can share one validated instance
+_DEFAULT_PARAMS = JobSearchParams(search_term="developer", location="NYC")
+_VALID_JOB = Job(
+    id="123",
+    title="Python Developer",
+    company="Tech Corp",
+    location="New York, NY",
+    job_url="https://example.com/job/123",
+    job_type="fulltime",
+    description="Great Python job"
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """Ensure cached health and job responses don't leak between tests"""
+    _health_cache.clear()
+    _jobs_cache.clear()
+    yield
+    _health_cache.clear()
+    _jobs_cache.clear()
+
+
+@pytest.fixture
+def override_settings(app_instance):
+    """Override the settings dependency for the duration of a test"""
+    def _override(**values):
+        app_instance.dependency_overrides[get_settings] = lambda: Settings(**values)
+
+    yield _override
+    app_instance.dependency_overrides.pop(get_settings, None)
+
+
+@pytest.fixture
+def mock_proxy_manager(monkeypatch):
+    """Replace the shared proxy manager used by the endpoints and the scraper"""
+    # Specced from the real instance so misspelled attributes fail loudly
+    mock = MagicMock(spec_set=real_proxy_manager)
+    monkeypatch.setattr(main, "proxy_manager", mock)
+    monkeypatch.setattr(scrape_jobs, "proxy_manager", mock)
+    return mock
+
+
+def test_api_docs_available(client):
+    """Test that API documentation is accessible"""
+    response = client.get("/docs")
+    assert response.status_code == 200
 
-client = TestClient(app)
 
+def test_openapi_schema_is_built_once(app_instance, client):
+    """Test the OpenAPI schema is served from the app's memoized copy"""
+    assert app_instance.openapi_schema is not None
+
+    response = client.get("/openapi.json")
 
-def test_api_docs_available():
-    """Test that API documentation is accessible"""
-    response = client.get("/docs")
     assert response.status_code == 200
+    assert response.json() == app_instance.openapi_schema
 
 
-def test_jobs_endpoint_requires_parameters():
+def test_jobs_endpoint_requires_parameters(client):
     """Test that the /jobs endpoint requires search_term and location"""
     response = client.get("/jobs")
     assert response.status_code == 422  # Validation error for missing required fields
 
 
-def test_jobs_endpoint_validates_parameters():
+def test_jobs_endpoint_validates_parameters(client):
     """Test parameter validation"""
     response = client.get("/jobs", params={
         "search_term": "python developer",
@@ -29,13 +86,10 @@ def test_jobs_endpoint_validates_parameters():
     assert response.status_code == 422  # Validation error
 
 
-@patch('app.scrape_jobs.scrape_jobs')
-def test_jobs_endpoint_success(mock_scrape_jobs):
+def test_jobs_endpoint_success(proxies_disabled, mock_scrape_jobs, client):
     """Test successful job retrieval with mocked data"""
-    # Mock the pandas DataFrame that scrape_jobs returns
-    mock_df = Mock()
-    mock_df.astype.return_value.where.return_value = mock_df
-    mock_df.to_dict.return_value = [
+    # Build the pandas DataFrame that scrape_jobs returns
+    mock_scrape_jobs.return_value = pd.DataFrame([
         {
             "id": "123",
             "title": "Python Developer",
@@ -47,8 +101,7 @@ def test_jobs_endpoint_success(mock_scrape_jobs):
             "description": "Great Python job",
             "is_remote": False
         }
-    ]
-    mock_scrape_jobs.return_value = mock_df
+    ])
 
     response = client.get("/jobs", params={
         "search_term": "python developer",
@@ -65,13 +118,10 @@ def test_jobs_endpoint_success(mock_scrape_jobs):
     assert data["jobs"][0]["is_remote"] is False
 
 
-@patch('app.scrape_jobs.scrape_jobs')
-def test_jobs_endpoint_returns_remote_jobs(mock_scrape_jobs):
+def test_jobs_endpoint_returns_remote_jobs(proxies_disabled, mock_scrape_jobs, client):
     """Test that API returns is_remote field correctly for remote jobs"""
-    # Mock the pandas DataFrame with remote job data
-    mock_df = Mock()
-    mock_df.astype.return_value.where.return_value = mock_df
-    mock_df.to_dict.return_value = [
+    # Build the pandas DataFrame with remote job data
+    mock_scrape_jobs.return_value = pd.DataFrame([
         {
             "id": "456",
             "title": "Remote Python Developer",
@@ -83,8 +133,7 @@ def test_jobs_endpoint_returns_remote_jobs(mock_scrape_jobs):
             "description": "Remote Python job",
             "is_remote": True
         }
-    ]
-    mock_scrape_jobs.return_value = mock_df
+    ])
 
     response = client.get("/jobs", params={
         "search_term": "python developer",
@@ -102,8 +151,34 @@ def test_jobs_endpoint_returns_remote_jobs(mock_scrape_jobs):
     assert data["jobs"][0]["is_remote"] is True
 
 
-@patch('app.scrape_jobs.scrape_jobs')
-def test_jobs_endpoint_handles_scraping_failure(mock_scrape_jobs):
+def test_jobs_endpoint_real_dataframe_nulls_and_extra_columns(proxies_disabled, mock_scrape_jobs, client):
+    """Test a JobSpy-shaped frame with nulls and extra columns converts end to end"""
+    mock_scrape_jobs.return_value = pd.DataFrame([
+        {"id": "1", "title": "Python Developer", "company": "Tech Corp",
+         "is_remote": True, "job_type": None, "company_industry": "Software",
+         "min_amount": 100000.0},
+        {"id": "2", "title": "Data Engineer", "company": None,
+         "is_remote": float("nan"), "job_type": "fulltime",
+         "company_industry": None, "min_amount": float("nan")},
+    ])
+
+    response = client.get("/jobs", params={
+        "search_term": "python developer",
+        "location": "New York"
+    })
+
+    assert response.status_code == 200
+    jobs = response.json()["jobs"]
+    assert [job["id"] for job in jobs] == ["1", "2"]
+    assert jobs[0]["is_remote"] is True
+    assert jobs[0]["job_type"] is None
+    assert jobs[1]["company"] is None
+    assert jobs[1]["is_remote"] is None
+    assert "company_industry" not in jobs[0]
+    assert "min_amount" not in jobs[1]
+
+
+def test_jobs_endpoint_handles_scraping_failure(proxies_disabled, mock_scrape_jobs, client):
     """Test that API handles scraping failures gracefully"""
     # Mock scrape_jobs to raise an exception
     mock_scrape_jobs.side_effect = Exception("LinkedIn is down")
@@ -123,49 +198,54 @@ def test_jobs_endpoint_handles_scraping_failure(mock_scrape_jobs):
     assert "LinkedIn is down" in data["error"]["message"]
 
 
-@pytest.mark.parametrize("params,expected_status", [
-    ({"search_term": "developer", "location": "NYC"}, 200),
-    ({"search_term": "developer", "location": "NYC", "job_type": "fulltime"}, 200),
-    ({"search_term": "developer", "location": "NYC", "is_remote": True}, 200),
-    ({"search_term": "developer", "location": "NYC", "distance": 25}, 200),
-    ({"search_term": "developer", "location": "NYC", "results_wanted": 50}, 200),
+VALID_PARAM_CASES = [
+    pytest.param({"search_term": "developer", "location": "NYC"}, id="defaults"),
+    pytest.param({"search_term": "developer", "location": "NYC", "job_type": "fulltime"},
+                 id="job-type"),
+    pytest.param({"search_term": "developer", "location": "NYC", "is_remote": True},
+                 id="remote"),
+    pytest.param({"search_term": "developer", "location": "NYC", "distance": 25},
+                 id="distance"),
+    pytest.param({"search_term": "developer", "location": "NYC", "results_wanted": 50},
+                 id="results-wanted"),
     # Empty search term is allowed by current model
-    ({"search_term": "", "location": "NYC"}, 200),
+    pytest.param({"search_term": "", "location": "NYC"}, id="empty-search-term"),
     # Empty location is allowed by current model
-    ({"search_term": "developer", "location": ""}, 200),
-    ({"search_term": "developer", "location": "NYC",
-     "results_wanted": 0}, 422),  # Invalid results_wanted
-])
-@patch('app.scrape_jobs.scrape_jobs')
-def test_parameter_combinations(mock_scrape_jobs, params, expected_status):
-    """Test various parameter combinations"""
-    if expected_status == 200:
-        mock_df = Mock()
-        mock_df.astype.return_value.where.return_value = mock_df
-        mock_df.to_dict.return_value = []
-        mock_scrape_jobs.return_value = mock_df
+    pytest.param({"search_term": "developer", "location": ""}, id="empty-location"),
+]
+
+INVALID_PARAM_CASES = [
+    pytest.param({"search_term": "developer", "location": "NYC", "results_wanted": 0},
+                 id="results-wanted-zero"),
+    pytest.param({"search_term": "developer", "location": "NYC", "distance": -1},
+                 id="negative-distance"),
+    pytest.param({"search_term": "developer", "location": "NYC", "job_type": "freelance"},
+                 id="unknown-job-type"),
+]
+
+
+@pytest.mark.parametrize("params", VALID_PARAM_CASES)
+def test_parameter_combinations_valid(proxies_disabled, mock_scrape_jobs, params, client):
+    """Test valid parameter combinations reach the scraper"""
+    response = client.get("/jobs", params=params)
+    assert response.status_code == 200
+    mock_scrape_jobs.assert_called_once()
+
 
+@pytest.mark.parametrize("params", INVALID_PARAM_CASES)
+def test_parameter_combinations_invalid(params, client):
+    """Test invalid parameter combinations are rejected before any scraping"""
     response = client.get("/jobs", params=params)
-    assert response.status_code == expected_status
+    assert response.status_code == 422
 
 
 def test_job_model_validation():
     """Test Job model accepts valid data"""
-    job_data = {
-        "id": "123",
-        "title": "Python Developer",
-        "company": "Tech Corp",
-        "location": "New York, NY",
-        "job_url": "https://example.com/job/123",
-        "job_type": "fulltime",
-        "description": "Great Python job"
-    }
-    job = Job(**job_data)
-    assert job.title == "Python Developer"
-    assert job.company == "Tech Corp"
-    assert job.location == "New York, NY"
+    assert _VALID_JOB.title == "Python Developer"
+    assert _VALID_JOB.company == "Tech Corp"
+    assert _VALID_JOB.location == "New York, NY"
     # Test that is_remote defaults to None when not provided
-    assert job.is_remote is None
+    assert _VALID_JOB.is_remote is None
 
 
 def test_job_model_accepts_none_values():
@@ -189,6 +269,8 @@ def test_job_model_accepts_none_values():
 
 def test_job_model_with_is_remote():
     """Test Job model with is_remote field explicitly set"""
+    # Only field pass-through is checked here, so validation is skipped;
+    # model_construct is never safe for untrusted input
     job_data_remote = {
         "id": "123",
         "title": "Remote Python Developer",
@@ -199,7 +281,7 @@ def test_job_model_with_is_remote():
         "description": "Remote Python job",
         "is_remote": True
     }
-    job_remote = Job(**job_data_remote)
+    job_remote = Job.model_construct(**job_data_remote)
     assert job_remote.is_remote is True
 
     job_data_not_remote = {
@@ -212,19 +294,18 @@ def test_job_model_with_is_remote():
         "description": "Onsite Python job",
         "is_remote": False
     }
-    job_not_remote = Job(**job_data_not_remote)
+    job_not_remote = Job.model_construct(**job_data_not_remote)
     assert job_not_remote.is_remote is False
 
 
 def test_job_search_params_defaults():
     """Test JobSearchParams has correct defaults"""
-    params = JobSearchParams(search_term="developer", location="NYC")
-    assert params.distance == 0
-    assert params.results_wanted == 10
-    assert params.hours_old == 24
-    assert params.is_remote is False
-    assert params.job_type is None
-    assert params.offset == 0
+    assert _DEFAULT_PARAMS.distance == 0
+    assert _DEFAULT_PARAMS.results_wanted == 10
+    assert _DEFAULT_PARAMS.hours_old == 24
+    assert _DEFAULT_PARAMS.is_remote is False
+    assert _DEFAULT_PARAMS.job_type is None
+    assert _DEFAULT_PARAMS.offset == 0
 
 
 def test_job_search_params_validation():
@@ -248,9 +329,38 @@ def test_job_search_params_validation():
     assert params.hours_old == 48
 
 
+def test_models_are_immutable():
+    """Test request and response models can't be mutated once built"""
+    with pytest.raises(ValueError):
+        _DEFAULT_PARAMS.search_term = "designer"
+
+    with pytest.raises(ValueError):
+        _VALID_JOB.title = "Designer"
+
+
+def test_job_model_ignores_extra_fields():
+    """Test unexposed JobSpy columns are dropped from Job models"""
+    job = Job(id="123", company_industry="Software")
+
+    assert "company_industry" not in job.model_dump()
+
+
+def test_scraping_error_suggested_actions_serialize_as_list():
+    """Test tuple suggested actions are still returned as a JSON array"""
+    error = ScrapingError(
+        error_type="scraping_failed",
+        message="Scraping failed",
+        suggested_actions=("Try again",)
+    )
+
+    assert error.model_dump(mode="json")["suggested_actions"] == ["Try again"]
+    assert ScrapingError(error_type="scraping_failed",
+                         message="Scraping failed").suggested_actions == ()
+
+
 def test_job_search_params_validation_errors():
     """Test JobSearchParams validation catches invalid values"""
-    with pytest.raises(ValueError):
+    with pytest.raises(ValidationError, match="job_type"):
         # Invalid job_type
         JobSearchParams(
             search_term="developer",
@@ -258,7 +368,7 @@ def test_job_search_params_validation_errors():
             job_type="invalid_type"
         )
 
-    with pytest.raises(ValueError):
+    with pytest.raises(ValidationError, match="results_wanted"):
         # Invalid results_wanted (too high)
         JobSearchParams(
             search_term="developer",
@@ -266,7 +376,7 @@ def test_job_search_params_validation_errors():
             results_wanted=150
         )
 
-    with pytest.raises(ValueError):
+    with pytest.raises(ValidationError, match="distance"):
         # Invalid distance (negative)
         JobSearchParams(
             search_term="developer",
@@ -275,14 +385,8 @@ def test_job_search_params_validation_errors():
         )
 
 
-@patch('app.scrape_jobs.scrape_jobs')
-def test_jobs_endpoint_with_all_parameters(mock_scrape_jobs):
+def test_jobs_endpoint_with_all_parameters(proxies_disabled, mock_scrape_jobs, client):
     """Test jobs endpoint with all optional parameters"""
-    mock_df = Mock()
-    mock_df.astype.return_value.where.return_value = mock_df
-    mock_df.to_dict.return_value = []
-    mock_scrape_jobs.return_value = mock_df
-
     response = client.get("/jobs", params={
         "search_term": "senior python developer",
         "location": "San Francisco",
@@ -312,14 +416,8 @@ def test_jobs_endpoint_with_all_parameters(mock_scrape_jobs):
     assert call_kwargs["hours_old"] == 72
 
 
-@patch('app.scrape_jobs.scrape_jobs')
-def test_jobs_endpoint_without_job_type(mock_scrape_jobs):
+def test_jobs_endpoint_without_job_type(proxies_disabled, mock_scrape_jobs, client):
     """Test that job_type parameter is not passed when None"""
-    mock_df = Mock()
-    mock_df.astype.return_value.where.return_value = mock_df
-    mock_df.to_dict.return_value = []
-    mock_scrape_jobs.return_value = mock_df
-
     response = client.get("/jobs", params={
         "search_term": "developer",
         "location": "Austin"
@@ -333,96 +431,109 @@ def test_jobs_endpoint_without_job_type(mock_scrape_jobs):
 
 
 # Proxy-related tests
-@patch('app.main.proxy_manager')
-def test_proxy_health_endpoint_success(mock_proxy_manager):
-    """Test proxy health endpoint with working proxies"""
-    mock_proxy_manager.get_proxy_list.return_value = [
-        "http://proxy1:8080", "http://proxy2:8080"]
-    mock_proxy_manager.last_update = 1234567890
-
-    response = client.get("/health/proxies")
+PROXY_ENDPOINT_CASES = [
+    pytest.param(
+        "get", "/health/proxies",
+        {"get_proxy_list.return_value": ["http://proxy1:8080", "http://proxy2:8080"],
+         "last_update": 1234567890, "is_stale": False},
+        200,
+        {"proxy_system_enabled": True, "working_proxies": 2,
+         "last_update": 1234567890, "is_stale": False, "status": "healthy"},
+        id="health-working-proxies"),
+    pytest.param(
+        "get", "/health/proxies",
+        {"get_proxy_list.return_value": [],
+         "last_update": 1234567890, "is_stale": False},
+        200,
+        {"proxy_system_enabled": True, "working_proxies": 0,
+         "last_update": 1234567890, "status": "no_proxies_available"},
+        id="health-no-proxies"),
+    pytest.param(
+        "get", "/health/proxies",
+        {"get_proxy_list.side_effect": Exception("Proxy service error")},
+        500,
+        {"proxy_system_enabled": True, "working_proxies": 0,
+         "error": "Proxy service error", "status": "error"},
+        id="health-error"),
+    pytest.param(
+        "post", "/admin/refresh-proxies",
+        {"get_proxy_list.return_value": ["http://proxy1:8080", "http://proxy2:8080"]},
+        200,
+        {"message": "Proxy list refreshed", "working_proxies": 2},
+        id="refresh-success"),
+    pytest.param(
+        "post", "/admin/refresh-proxies",
+        {"get_proxy_list.side_effect": Exception("Refresh failed")},
+        500,
+        {"detail": "Failed to refresh proxies: Refresh failed"},
+        id="refresh-error"),
+]
+
+
+@pytest.mark.parametrize(
+    "method,path,proxy_manager_config,expected_status,expected_body", PROXY_ENDPOINT_CASES)
+def test_proxy_endpoints(mock_proxy_manager, client, method, path, proxy_manager_config,
+                         expected_status, expected_body):
+    """Test proxy health and refresh endpoints for each proxy manager state"""
+    mock_proxy_manager.configure_mock(**proxy_manager_config)
+
+    response = client.request(method, path)
 
-    assert response.status_code == 200
-    data = response.json()
-    assert data["proxy_system_enabled"] is True
-    assert data["working_proxies"] == 2
-    assert data["last_update"] == 1234567890
-    assert data["status"] == "healthy"
+    assert response.status_code == expected_status
+    assert response.json().items() >= expected_body.items()
 
 
-@patch('app.main.proxy_manager')
-def test_proxy_health_endpoint_no_proxies(mock_proxy_manager):
-    """Test proxy health endpoint with no working proxies"""
-    mock_proxy_manager.get_proxy_list.return_value = None
+def test_proxy_health_endpoint_is_cached(mock_proxy_manager, client):
+    """Test proxy health responses are cached between polls"""
+    mock_proxy_manager.get_proxy_list.return_value = ["http://proxy1:8080"]
     mock_proxy_manager.last_update = 1234567890
+    mock_proxy_manager.is_stale = False
 
-    response = client.get("/health/proxies")
+    first = client.get("/health/proxies")
+    second = client.get("/health/proxies")
 
-    assert response.status_code == 200
-    data = response.json()
-    assert data["proxy_system_enabled"] is True
-    assert data["working_proxies"] == 0
-    assert data["last_update"] == 1234567890
-    assert data["status"] == "no_proxies_available"
+    assert first.json() == second.json()
+    assert "max-age=" in second.headers["cache-control"]
+    mock_proxy_manager.get_proxy_list.assert_called_once()
 
 
-@patch('app.main.proxy_manager')
-def test_proxy_health_endpoint_error(mock_proxy_manager):
-    """Test proxy health endpoint when proxy manager fails"""
-    mock_proxy_manager.get_proxy_list.side_effect = Exception(
-        "Proxy service error")
+def test_proxy_health_endpoint_etag_revalidation(mock_proxy_manager, client):
+    """Test health responses carry an ETag and honour If-None-Match"""
+    mock_proxy_manager.get_proxy_list.return_value = ["http://proxy1:8080"]
+    mock_proxy_manager.last_update = 1234567890
+    mock_proxy_manager.is_stale = False
 
-    response = client.get("/health/proxies")
+    first = client.get("/health/proxies")
+    etag = first.headers["etag"]
 
-    assert response.status_code == 500
-    data = response.json()
-    assert data["proxy_system_enabled"] is True
-    assert data["working_proxies"] == 0
-    assert "error" in data
-    assert data["status"] == "error"
+    second = client.get("/health/proxies", headers={"If-None-Match": etag})
+    changed = client.get("/health/proxies",
+                         headers={"If-None-Match": '"outdated"'})
 
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert changed.status_code == 200
+    assert changed.json() == first.json()
 
-@patch('app.main.proxy_manager')
-def test_refresh_proxies_endpoint_success(mock_proxy_manager):
-    """Test proxy refresh endpoint success"""
-    mock_proxy_manager.get_proxy_list.return_value = [
-        "http://proxy1:8080", "http://proxy2:8080"]
+
+def test_refresh_proxies_endpoint_forces_refresh(mock_proxy_manager, client):
+    """Test proxy refresh bypasses the proxy cache and isn't cached itself"""
+    mock_proxy_manager.get_proxy_list.return_value = ["http://proxy1:8080"]
 
     response = client.post("/admin/refresh-proxies")
 
-    assert response.status_code == 200
-    data = response.json()
-    assert data["message"] == "Proxy list refreshed"
-    assert data["working_proxies"] == 2
+    assert response.headers["cache-control"] == "no-store"
     mock_proxy_manager.get_proxy_list.assert_called_once_with(
         force_refresh=True)
 
 
-@patch('app.main.proxy_manager')
-def test_refresh_proxies_endpoint_error(mock_proxy_manager):
-    """Test proxy refresh endpoint error handling"""
-    mock_proxy_manager.get_proxy_list.side_effect = Exception("Refresh failed")
-
-    response = client.post("/admin/refresh-proxies")
-
-    assert response.status_code == 500
-    data = response.json()
-    assert "Failed to refresh proxies" in data["detail"]
-
-
-@patch('app.scrape_jobs.scrape_jobs')
-@patch('app.scrape_jobs.proxy_manager')
-@patch('app.scrape_jobs.settings')
-def test_jobs_endpoint_with_proxy_support(mock_settings, mock_proxy_manager, mock_scrape_jobs):
+def test_jobs_endpoint_with_proxy_support(mock_settings, mock_proxy_manager, mock_scrape_jobs, client):
     """Test that jobs endpoint uses proxies when available"""
     mock_settings.USE_PROXIES = True
     mock_proxy_manager.get_proxy_list.return_value = [
         "http://proxy1:8080", "http://proxy2:8080"]
-
-    mock_df = Mock()
-    mock_df.astype.return_value.where.return_value = mock_df
-    mock_df.to_dict.return_value = []
-    mock_scrape_jobs.return_value = mock_df
+    mock_proxy_manager.probe_proxies.side_effect = lambda proxies: proxies
 
     response = client.get("/jobs", params={
         "search_term": "python developer",
@@ -437,18 +548,8 @@ def test_jobs_endpoint_with_proxy_support(mock_settings, mock_proxy_manager, moc
         "http://proxy1:8080", "http://proxy2:8080"]
 
 
-@patch('app.scrape_jobs.scrape_jobs')
-@patch('app.scrape_jobs.proxy_manager')
-@patch('app.scrape_jobs.settings')
-def test_jobs_endpoint_proxy_disabled(mock_settings, mock_proxy_manager, mock_scrape_jobs):
+def test_jobs_endpoint_proxy_disabled(proxies_disabled, mock_proxy_manager, mock_scrape_jobs, client):
     """Test that jobs endpoint works without proxies when disabled"""
-    mock_settings.USE_PROXIES = False
-
-    mock_df = Mock()
-    mock_df.astype.return_value.where.return_value = mock_df
-    mock_df.to_dict.return_value = []
-    mock_scrape_jobs.return_value = mock_df
-
     response = client.get("/jobs", params={
         "search_term": "python developer",
         "location": "New York"
@@ -464,13 +565,12 @@ def test_jobs_endpoint_proxy_disabled(mock_settings, mock_proxy_manager, mock_sc
     assert call_kwargs["proxies"] is None
 
 
-@patch('app.scrape_jobs.proxy_manager')
-@patch('app.scrape_jobs.settings')
-def test_jobs_endpoint_no_proxies_fallback_disabled(mock_settings, mock_proxy_manager):
+def test_jobs_endpoint_no_proxies_fallback_disabled(mock_settings, mock_proxy_manager, client):
     """Test that jobs endpoint returns structured error when no proxies available and fallback disabled"""
     mock_settings.USE_PROXIES = True
     mock_settings.PROXY_FALLBACK_ENABLED = False
-    mock_proxy_manager.get_proxy_list.return_value = None  # No proxies available
+    mock_proxy_manager.get_proxy_list.return_value = []  # No proxies available
+    mock_proxy_manager.probe_proxies.return_value = []
 
     response = client.get("/jobs", params={
         "search_term": "python developer",
@@ -487,19 +587,12 @@ def test_jobs_endpoint_no_proxies_fallback_disabled(mock_settings, mock_proxy_ma
     assert "POST /admin/refresh-proxies" in data["error"]["suggested_actions"][0]
 
 
-@patch('app.scrape_jobs.scrape_jobs')
-@patch('app.scrape_jobs.proxy_manager')
-@patch('app.scrape_jobs.settings')
-def test_jobs_endpoint_no_proxies_fallback_enabled(mock_settings, mock_proxy_manager, mock_scrape_jobs):
+def test_jobs_endpoint_no_proxies_fallback_enabled(mock_settings, mock_proxy_manager, mock_scrape_jobs, client):
     """Test that jobs endpoint continues without proxies when fallback enabled"""
     mock_settings.USE_PROXIES = True
     mock_settings.PROXY_FALLBACK_ENABLED = True
-    mock_proxy_manager.get_proxy_list.return_value = None  # No proxies available
-
-    mock_df = Mock()
-    mock_df.astype.return_value.where.return_value = mock_df
-    mock_df.to_dict.return_value = []
-    mock_scrape_jobs.return_value = mock_df
+    mock_proxy_manager.get_proxy_list.return_value = []  # No proxies available
+    mock_proxy_manager.probe_proxies.return_value = []
 
     response = client.get("/jobs", params={
         "search_term": "python developer",
@@ -516,9 +609,7 @@ def test_jobs_endpoint_no_proxies_fallback_enabled(mock_settings, mock_proxy_man
     assert call_kwargs["proxies"] is None
 
 
-@patch('app.scrape_jobs.proxy_manager')
-@patch('app.scrape_jobs.settings')
-def test_jobs_endpoint_proxy_fetch_fails_fallback_disabled(mock_settings, mock_proxy_manager):
+def test_jobs_endpoint_proxy_fetch_fails_fallback_disabled(mock_settings, mock_proxy_manager, client):
     """Test that jobs endpoint returns empty list when proxy fetch fails and fallback disabled"""
     mock_settings.USE_PROXIES = True
     mock_settings.PROXY_FALLBACK_ENABLED = False
@@ -540,12 +631,9 @@ def test_jobs_endpoint_proxy_fetch_fails_fallback_disabled(mock_settings, mock_p
     assert "Proxy service unavailable" in data["error"]["message"]
 
 
-@patch('app.main.proxy_manager')
-@patch('app.config.settings')
-def test_scraping_health_with_proxies_available(mock_settings, mock_proxy_manager):
+def test_scraping_health_with_proxies_available(mock_proxy_manager, override_settings, client):
     """Test /health/scraping when proxies are available"""
-    mock_settings.USE_PROXIES = True
-    mock_settings.PROXY_FALLBACK_ENABLED = True
+    override_settings(USE_PROXIES=True, PROXY_FALLBACK_ENABLED=True)
     mock_proxy_manager.get_proxy_list.return_value = [
         "http://proxy1:8080", "http://proxy2:8080"]
 
@@ -560,12 +648,9 @@ def test_scraping_health_with_proxies_available(mock_settings, mock_proxy_manage
     assert "available" in data["reason"]
 
 
-@patch('app.main.proxy_manager')
-@patch('app.config.settings')
-def test_scraping_health_no_proxies_fallback_disabled(mock_settings, mock_proxy_manager):
+def test_scraping_health_no_proxies_fallback_disabled(mock_proxy_manager, override_settings, client):
     """Test /health/scraping when no proxies and fallback disabled"""
-    mock_settings.USE_PROXIES = True
-    mock_settings.PROXY_FALLBACK_ENABLED = False
+    override_settings(USE_PROXIES=True, PROXY_FALLBACK_ENABLED=False)
     mock_proxy_manager.get_proxy_list.return_value = []
 
     response = client.get("/health/scraping")
@@ -579,12 +664,9 @@ def test_scraping_health_no_proxies_fallback_disabled(mock_settings, mock_proxy_
     assert "No working proxies and fallback disabled" in data["reason"]
 
 
-@patch('app.main.proxy_manager')
-@patch('app.config.settings')
-def test_scraping_health_without_proxies(mock_settings, mock_proxy_manager):
+def test_scraping_health_without_proxies(mock_proxy_manager, override_settings, client):
     """Test /health/scraping when not using proxies"""
-    mock_settings.USE_PROXIES = False
-    mock_settings.PROXY_FALLBACK_ENABLED = False
+    override_settings(USE_PROXIES=False, PROXY_FALLBACK_ENABLED=False)
     mock_proxy_manager.get_proxy_list.return_value = []
 
     response = client.get("/health/scraping")
@@ -598,8 +680,7 @@ def test_scraping_health_without_proxies(mock_settings, mock_proxy_manager):
     assert "available" in data["reason"]
 
 
-@patch('app.main.proxy_manager')
-def test_scraping_health_exception_handling(mock_proxy_manager):
+def test_scraping_health_exception_handling(mock_proxy_manager, client):
     """Test /health/scraping exception handling"""
     mock_proxy_manager.get_proxy_list.side_effect = Exception(
         "Proxy manager error")
@@ -612,3 +693,275 @@ def test_scraping_health_exception_handling(mock_proxy_manager):
     assert "error" in data
     assert "Proxy manager error" in data["error"]
     assert "Error checking scraping availability" in data["reason"]
+
+
+def test_job_description_endpoint_success(monkeypatch, override_settings, client):
+    """Test a single job's description is fetched on demand"""
+    mock_fetch = MagicMock()
+    monkeypatch.setattr(main, "fetch_job_details", mock_fetch)
+
+    override_settings(USE_PROXIES=False)
+    mock_fetch.return_value = [
+        {"description": "Build things", "job_type": "fulltime"}]
+
+    response = client.get("/jobs/li-123/description")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["id"] == "li-123"
+    assert data["job_url"] == "https://www.linkedin.com/jobs/view/123"
+    assert data["description"] == "Build things"
+    assert data["job_type"] == "fulltime"
+    mock_fetch.assert_called_once_with(
+        ["https://www.linkedin.com/jobs/view/123"], None)
+
+
+def test_job_description_endpoint_validates_job_id(client):
+    """Test job ids that aren't LinkedIn ids are rejected"""
+    response = client.get("/jobs/not-a-job/description")
+    assert response.status_code == 422
+
+
+def test_job_description_endpoint_fetch_fails(monkeypatch, override_settings, client):
+    """Test an unreadable job page returns 502"""
+    mock_fetch = MagicMock()
+    monkeypatch.setattr(main, "fetch_job_details", mock_fetch)
+
+    override_settings(USE_PROXIES=False)
+    mock_fetch.return_value = [{}]
+
+    response = client.get("/jobs/123/description")
+    assert response.status_code == 502
+
+
+def test_job_description_endpoint_no_proxies_fallback_disabled(
+        mock_proxy_manager, monkeypatch, override_settings, client):
+    """Test job descriptions aren't fetched directly when fallback is disabled"""
+    mock_fetch = MagicMock()
+    monkeypatch.setattr(main, "fetch_job_details", mock_fetch)
+
+    override_settings(USE_PROXIES=True, PROXY_FALLBACK_ENABLED=False)
+    mock_proxy_manager.get_proxy_list.return_value = ["http://proxy1:8080"]
+    mock_proxy_manager.probe_proxies.return_value = []
+
+    response = client.get("/jobs/123/description")
+    assert response.status_code == 503
+    assert response.json()["detail"] == (
+        "No working proxies available and fallback is disabled")
+    mock_fetch.assert_not_called()
+
+
+def test_job_description_endpoint_proxy_fetch_fails_fallback_disabled(
+        mock_proxy_manager, monkeypatch, override_settings, client):
+    """Test a proxy list failure is reported as 503 rather than an unhandled error"""
+    mock_fetch = MagicMock()
+    monkeypatch.setattr(main, "fetch_job_details", mock_fetch)
+
+    override_settings(USE_PROXIES=True, PROXY_FALLBACK_ENABLED=False)
+    mock_proxy_manager.get_proxy_list.side_effect = Exception("Proxy service down")
+
+    response = client.get("/jobs/123/description")
+    assert response.status_code == 503
+    assert "Proxy service down" in response.json()["detail"]
+    mock_fetch.assert_not_called()
+
+
+def test_job_description_endpoint_uses_probed_proxies(
+        mock_proxy_manager, monkeypatch, override_settings, client):
+    """Test the job page is fetched only through proxies that passed the probe"""
+    mock_fetch = MagicMock(return_value=[{"description": "Build things"}])
+    monkeypatch.setattr(main, "fetch_job_details", mock_fetch)
+
+    override_settings(USE_PROXIES=True, PROXY_FALLBACK_ENABLED=False)
+    mock_proxy_manager.get_proxy_list.return_value = [
+        "http://proxy1:8080", "http://proxy2:8080"]
+    mock_proxy_manager.probe_proxies.return_value = ["http://proxy2:8080"]
+
+    response = client.get("/jobs/123/description")
+    assert response.status_code == 200
+    mock_proxy_manager.probe_proxies.assert_called_once_with(
+        ["http://proxy1:8080", "http://proxy2:8080"])
+    mock_fetch.assert_called_once_with(
+        ["https://www.linkedin.com/jobs/view/123"], ["http://proxy2:8080"])
+
+
+def test_jobs_endpoint_runs_scrapes_on_dedicated_pool(monkeypatch, client):
+    """Test scrapes run on the bounded scrape pool rather than the shared threadpool"""
+    mock_get_jobs = MagicMock()
+    monkeypatch.setattr(main, "get_jobs", mock_get_jobs)
+
+    thread_names = []
+
+    def _get_jobs(params):
+        thread_names.append(threading.current_thread().name)
+        return {"success": True, "jobs": []}
+
+    mock_get_jobs.side_effect = _get_jobs
+
+    response = client.get("/jobs", params={
+        "search_term": "python developer",
+        "location": "New York"
+    })
+    assert response.status_code == 200
+    assert thread_names[0].startswith("scrape")
+
+
+def test_jobs_endpoint_serializes_with_response_model(proxies_disabled, monkeypatch, mock_scrape_jobs, client):
+    """Test /jobs is serialized straight to JSON by Pydantic, not jsonable_encoder"""
+    mock_encoder = MagicMock(side_effect=AssertionError("slow path"))
+    monkeypatch.setattr(fastapi_routing, "jsonable_encoder", mock_encoder)
+
+    mock_scrape_jobs.return_value = pd.DataFrame([
+        {"id": "1", "title": "Python Developer", "description": "x" * 5000}])
+
+    response = client.get("/jobs", params={
+        "search_term": "python developer",
+        "location": "New York"
+    })
+
+    assert response.status_code == 200
+    assert response.json()["jobs"][0]["description"] == "x" * 5000
+    mock_encoder.assert_not_called()
+
+
+def test_jobs_stream_endpoint_returns_ndjson(proxies_disabled, mock_scrape_jobs, client):
+    """Test /jobs/stream emits one JSON job per line"""
+    mock_scrape_jobs.return_value = pd.DataFrame([
+        {"id": "1", "title": "Python Developer"},
+        {"id": "2", "title": "Data Engineer"},
+    ])
+
+    response = client.get("/jobs/stream", params={
+        "search_term": "python developer",
+        "location": "New York"
+    })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert [Job.model_validate_json(line).id for line in lines] == ["1", "2"]
+
+
+def test_jobs_stream_endpoint_streams_descriptions(proxies_disabled, monkeypatch, mock_scrape_jobs, client):
+    """Test jobs with descriptions are sent first and the rest as their pages arrive"""
+    mock_iter_details = MagicMock()
+    monkeypatch.setattr(scrape_jobs, "iter_job_details", mock_iter_details)
+
+    mock_scrape_jobs.return_value = pd.DataFrame([
+        {"id": "1", "job_url": "https://example.com/job/1", "description": None},
+        {"id": "2", "job_url": "https://example.com/job/2", "description": "Known"},
+    ])
+    mock_iter_details.return_value = iter(
+        [(0, {"description": "Fetched", "job_type": "fulltime"})])
+
+    response = client.get("/jobs/stream", params={
+        "search_term": "python developer",
+        "location": "New York",
+        "include_descriptions": True
+    })
+
+    jobs = [Job.model_validate_json(line) for line in response.text.splitlines()]
+    assert [(job.id, job.description) for job in jobs] == [
+        ("2", "Known"), ("1", "Fetched")]
+    assert jobs[1].job_type == "fulltime"
+
+    # The listing itself is scraped without descriptions
+    assert mock_scrape_jobs.call_args[1]["linkedin_fetch_description"] is False
+
+
+def test_jobs_stream_endpoint_fetches_descriptions_through_probed_proxies(
+        monkeypatch, mock_settings, mock_proxy_manager, mock_scrape_jobs, client):
+    """Test job pages are fetched through the proxies that passed the probe"""
+    mock_iter_details = MagicMock(return_value=iter([]))
+    monkeypatch.setattr(scrape_jobs, "iter_job_details", mock_iter_details)
+    mock_settings.USE_PROXIES = True
+    mock_settings.PROXY_FALLBACK_ENABLED = False
+    mock_proxy_manager.get_proxy_list.return_value = [
+        "http://proxy1:8080", "http://proxy2:8080"]
+    mock_proxy_manager.probe_proxies.return_value = ["http://proxy2:8080"]
+    mock_scrape_jobs.return_value = pd.DataFrame([
+        {"id": "1", "job_url": "https://example.com/job/1", "description": None}])
+
+    client.get("/jobs/stream", params={
+        "search_term": "python developer",
+        "location": "New York",
+        "include_descriptions": True
+    })
+
+    mock_iter_details.assert_called_once_with(
+        ["https://example.com/job/1"], ["http://proxy2:8080"])
+
+
+def test_jobs_stream_endpoint_no_proxies_fallback_disabled(
+        monkeypatch, mock_settings, mock_proxy_manager, mock_scrape_jobs, client):
+    """Test descriptions aren't fetched directly when no proxies work and fallback is off"""
+    mock_iter_details = MagicMock()
+    monkeypatch.setattr(scrape_jobs, "iter_job_details", mock_iter_details)
+    mock_settings.USE_PROXIES = True
+    mock_settings.PROXY_FALLBACK_ENABLED = False
+    mock_proxy_manager.get_proxy_list.return_value = ["http://proxy1:8080"]
+    # The listing is scraped while the proxy works, then it stops responding
+    mock_proxy_manager.probe_proxies.side_effect = [["http://proxy1:8080"], []]
+    mock_scrape_jobs.return_value = pd.DataFrame([
+        {"id": "1", "job_url": "https://example.com/job/1", "description": None}])
+
+    response = client.get("/jobs/stream", params={
+        "search_term": "python developer",
+        "location": "New York",
+        "include_descriptions": True
+    })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert data["success"] is False
+    assert data["error"]["error_type"] == "proxy_unavailable"
+    mock_iter_details.assert_not_called()
+
+
+def test_jobs_stream_endpoint_returns_errors_as_json(proxies_disabled, mock_scrape_jobs, client):
+    """Test a failed search is returned as a regular JSON error response"""
+    mock_scrape_jobs.side_effect = Exception("LinkedIn API error")
+
+    response = client.get("/jobs/stream", params={
+        "search_term": "python developer",
+        "location": "New York"
+    })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert data["success"] is False
+    assert data["error"]["error_type"] == "scraping_failed"
+
+
+def test_jobs_endpoint_compresses_large_responses(proxies_disabled, mock_scrape_jobs, client):
+    """Test large responses are gzipped for clients that accept it"""
+    mock_scrape_jobs.return_value = pd.DataFrame([
+        {"id": str(i), "description": "Benefits and disclaimers " * 50}
+        for i in range(10)])
+
+    response = client.get("/jobs", params={
+        "search_term": "python developer",
+        "location": "New York"
+    }, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["jobs"]) == 10
+
+    # Compressed responses still revalidate against their ETag
+    revalidated = client.get("/jobs", params={
+        "search_term": "python developer",
+        "location": "New York"
+    }, headers={"Accept-Encoding": "gzip",
+                "If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+
+
+def test_small_responses_are_not_compressed(client):
+    """Test responses under the size threshold are sent uncompressed"""
+    response = client.get("/jobs", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 422
+    assert "content-encoding" not in response.headers
@@ -1,7 +1,26 @@
-import pytest
-from unittest.mock import Mock, patch, MagicMock
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 from app.proxy_manager import ProxyManager
 
+PROXY_LINES_BASIC = ("1.2.3.4:8080", "5.6.7.8:3128", "9.10.11.12:8080")
+
+PROXY_LINES_MIXED_PROTOCOLS = (
+    "",
+    "        http://1.2.3.4:8080",
+    "        socks4://5.6.7.8:1080",
+    "        socks5://9.10.11.12:1080  ",
+    "        https://13.14.15.16:443",
+    "        17.18.19.20:3128",
+    "        ",
+)
+
+
+def _proxy_list_response(lines):
+    """Build a streamed proxy list response; a fresh Mock so call counts don't leak"""
+    return Mock(status_code=200, **{"iter_lines.return_value": list(lines)})
+
 
 class TestProxyManager:
 
@@ -9,23 +28,22 @@ class TestProxyManager:
         """Test successful proxy fetching"""
         proxy_manager = ProxyManager()
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = "1.2.3.4:8080\n5.6.7.8:3128\n9.10.11.12:8080"
+        mock_response = _proxy_list_response(PROXY_LINES_BASIC)
 
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             proxies = proxy_manager._fetch_free_proxies()
 
         assert len(proxies) >= 3  # At least the unique proxies
         assert "http://1.2.3.4:8080" in proxies
         assert "http://5.6.7.8:3128" in proxies
         assert "http://9.10.11.12:8080" in proxies
+        mock_response.close.assert_called_once()
 
     def test_fetch_free_proxies_failure(self):
         """Test handling of proxy fetching failure"""
         proxy_manager = ProxyManager()
 
-        with patch('requests.get', side_effect=Exception("Network error")):
+        with patch('requests.Session.get', side_effect=Exception("Network error")):
             proxies = proxy_manager._fetch_free_proxies()
 
         assert proxies == []
@@ -61,18 +79,32 @@ class TestProxyManager:
         proxy_manager = ProxyManager()
 
         mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response.status_code = 204
+
+        with patch('requests.Session.head', return_value=mock_response) as mock_head:
+            result = proxy_manager._test_proxy("http://1.2.3.4:8080")
+
+        assert result is True
+        mock_head.assert_called_once()
+
+    def test_test_proxy_falls_back_to_second_url(self):
+        """Test the second connectivity check is used when the first isn't a 204"""
+        proxy_manager = ProxyManager()
+
+        intercepted = Mock(status_code=200)
+        success = Mock(status_code=204)
 
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.head', side_effect=[intercepted, success]) as mock_head:
             result = proxy_manager._test_proxy("http://1.2.3.4:8080")
 
         assert result is True
+        assert mock_head.call_count == 2
 
     def test_test_proxy_failure(self):
         """Test proxy testing failure"""
         proxy_manager = ProxyManager()
 
-        with patch('requests.get', side_effect=Exception("Connection failed")):
+        with patch('requests.Session.head', side_effect=Exception("Connection failed")):
             result = proxy_manager._test_proxy("http://1.2.3.4:8080")
 
         assert result is False
@@ -106,23 +138,15 @@ class TestProxyManager:
             with patch.object(proxy_manager, '_validate_proxies', return_value=[]):
                 proxies = proxy_manager.get_proxy_list(force_refresh=True)
 
-        assert proxies is None
+        assert proxies == []
 
     def test_fetch_free_proxies_with_different_protocols(self):
         """Test proxy parsing with different protocols"""
         proxy_manager = ProxyManager()
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
-        http://1.2.3.4:8080
-        socks4://5.6.7.8:1080
-        socks5://9.10.11.12:1080  
-        https://13.14.15.16:443
-        17.18.19.20:3128
-        """
-
-        with patch('requests.get', return_value=mock_response):
+        mock_response = _proxy_list_response(PROXY_LINES_MIXED_PROTOCOLS)
+
+        with patch('requests.Session.get', return_value=mock_response):
             proxies = proxy_manager._fetch_free_proxies()
 
         # Should only include HTTP proxies and plain IP:port (converted to HTTP)
@@ -145,7 +169,7 @@ class TestProxyManager:
                     # Verify warning was logged (line 128)
                     mock_logger.warning.assert_called_with(
                         "No working proxies found")
-                    assert proxies is None
+                    assert proxies == []
 
     def test_get_proxy_list_no_proxy_fetch_failure(self):
         """Test when proxy fetching fails completely"""
@@ -158,4 +182,166 @@ class TestProxyManager:
                 # Should warn about no proxies being fetched
                 mock_logger.warning.assert_called_with(
                     "Failed to fetch any proxies")
-                assert proxies is None
+                assert proxies == []
+
+    def test_thread_session_is_reused(self):
+        """Test that each thread reuses its pooled session"""
+        proxy_manager = ProxyManager()
+
+        session = proxy_manager._get_thread_session()
+
+        assert proxy_manager._get_thread_session() is session
+        assert session is not proxy_manager._session
+
+    def test_proxy_validation_tests_proxies_concurrently(self):
+        """Test every candidate is checked at once rather than one after another"""
+        proxy_manager = ProxyManager()
+        proxies = [f"http://1.2.3.{i}:8080" for i in range(4)]
+        # Only releases once all proxies are being tested at the same time
+        barrier = threading.Barrier(len(proxies), timeout=5)
+
+        def mock_test_proxy(proxy):
+            barrier.wait()
+            return True
+
+        with patch.object(proxy_manager, '_test_proxy', side_effect=mock_test_proxy):
+            working = proxy_manager._validate_proxies(proxies)
+
+        assert sorted(working) == sorted(proxies)
+
+    def test_proxy_validation_stops_after_enough_working(self):
+        """Test validation stops once enough working proxies are found"""
+        proxy_manager = ProxyManager()
+        proxy_manager.max_working = 5
+        proxies = [f"http://1.2.3.{i}:8080" for i in range(30)]
+
+        with patch.object(proxy_manager, '_test_proxy', return_value=True):
+            working = proxy_manager._validate_proxies(proxies)
+
+        assert len(working) == 5
+        assert set(working) <= set(proxies)
+
+    def test_get_proxy_list_serves_stale_on_refresh_failure(self):
+        """Test the last known good list is kept when a refresh fails"""
+        proxy_manager = ProxyManager()
+        proxy_manager.working_proxies = ["http://old.proxy:8080"]
+        proxy_manager.last_update = time.time()
+
+        with patch.object(proxy_manager, '_fetch_free_proxies', return_value=["http://1.2.3.4:8080"]):
+            with patch.object(proxy_manager, '_validate_proxies', return_value=[]):
+                proxies = proxy_manager.get_proxy_list(force_refresh=True)
+
+        assert proxies == ["http://old.proxy:8080"]
+        assert proxy_manager.is_stale is True
+
+    def test_get_proxy_list_discards_list_past_max_staleness(self):
+        """Test a stale list is dropped once it exceeds max staleness"""
+        proxy_manager = ProxyManager()
+        proxy_manager.working_proxies = ["http://old.proxy:8080"]
+        proxy_manager.last_update = time.time() - proxy_manager.max_staleness - 1
+
+        with patch.object(proxy_manager, '_fetch_free_proxies', return_value=[]):
+            proxies = proxy_manager.get_proxy_list(force_refresh=True)
+
+        assert proxies == []
+        assert proxy_manager.is_stale is False
+
+    def test_get_proxy_list_refreshes_expired_list_in_background(self):
+        """Test an expired list is served while a background refresh runs"""
+        proxy_manager = ProxyManager()
+        proxy_manager.working_proxies = ["http://old.proxy:8080"]
+        proxy_manager.last_update = 0
+
+        with patch('app.proxy_manager.threading.Thread') as mock_thread:
+            proxies = proxy_manager.get_proxy_list()
+
+        assert proxies == ["http://old.proxy:8080"]
+        event = proxy_manager._refresh_event
+        mock_thread.assert_called_once_with(
+            target=proxy_manager._refresh_in_background, args=(event,),
+            daemon=True)
+        mock_thread.return_value.start.assert_called_once()
+
+        with patch.object(proxy_manager, '_load_proxies', return_value=["http://1.2.3.4:8080"]):
+            proxy_manager._refresh_in_background(event)
+
+        assert proxy_manager.working_proxies == ["http://1.2.3.4:8080"]
+        assert proxy_manager._refresh_event is None
+        assert event.is_set()
+
+    def test_get_proxy_list_waits_for_in_progress_refresh(self):
+        """Test concurrent refreshes share one fetch and validation"""
+        proxy_manager = ProxyManager()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_load():
+            started.set()
+            release.wait(timeout=5)
+            return ["http://1.2.3.4:8080"]
+
+        with patch.object(proxy_manager, '_load_proxies', side_effect=slow_load) as mock_load:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                leader = executor.submit(
+                    proxy_manager.get_proxy_list, force_refresh=True)
+                assert started.wait(timeout=5)
+
+                # Note when the follower starts waiting on the leader's refresh
+                event = proxy_manager._refresh_event
+                event_wait = event.wait
+                waiting = threading.Event()
+
+                def tracked_wait(timeout=None):
+                    waiting.set()
+                    return event_wait(timeout)
+
+                event.wait = tracked_wait
+
+                follower = executor.submit(
+                    proxy_manager.get_proxy_list, force_refresh=True)
+                assert waiting.wait(timeout=5)
+                release.set()
+
+                assert leader.result(timeout=5) == ["http://1.2.3.4:8080"]
+                assert follower.result(timeout=5) == ["http://1.2.3.4:8080"]
+
+        mock_load.assert_called_once()
+
+    def test_probe_proxies_keeps_only_reachable(self):
+        """Test proxies that error or get an error status are dropped before a scrape"""
+        proxy_manager = ProxyManager()
+
+        def mock_head(url, proxies=None, **kwargs):
+            if proxies["http"] == "http://1.1.1.1:8080":
+                return Mock(status_code=200)
+            if proxies["http"] == "http://2.2.2.2:8080":
+                return Mock(status_code=999)
+            raise Exception("Connection failed")
+
+        with patch('requests.Session.head', side_effect=mock_head):
+            working = proxy_manager.probe_proxies([
+                "http://1.1.1.1:8080", "http://2.2.2.2:8080", "http://3.3.3.3:8080"])
+
+        assert working == ["http://1.1.1.1:8080"]
+
+    def test_probe_proxies_reuses_recent_results(self):
+        """Test proxies probed moments ago aren't probed again"""
+        proxy_manager = ProxyManager()
+
+        with patch.object(proxy_manager, '_probe_proxy', return_value=True) as mock_probe:
+            proxy_manager.probe_proxies(["http://1.2.3.4:8080"])
+            working = proxy_manager.probe_proxies(
+                ["http://1.2.3.4:8080", "http://5.6.7.8:3128"])
+
+        assert working == ["http://1.2.3.4:8080", "http://5.6.7.8:3128"]
+        assert [call.args[0] for call in mock_probe.call_args_list] == [
+            "http://1.2.3.4:8080", "http://5.6.7.8:3128"]
+
+    def test_probe_proxies_empty(self):
+        """Test probing no proxies makes no requests"""
+        proxy_manager = ProxyManager()
+
+        with patch('requests.Session.head') as mock_head:
+            assert proxy_manager.probe_proxies([]) == []
+
+        mock_head.assert_not_called()
@@ -8,8 +8,9 @@ echo "🧪 Running tests with coverage..."
 # Ensure PYTHONPATH is set
 export PYTHONPATH=.
 
-# Run pytest with coverage
-pytest --cov=app \
+# Run pytest with coverage, spreading test files across CPUs
+pytest -n auto --dist=loadfile \
+       --cov=app \
        --cov-report=xml \
        --cov-report=html \
        --cov-report=term-missing \